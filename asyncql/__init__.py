@@ -1,6 +1,15 @@
+from asyncql.models.admission import AdmissionController, PriorityClass
 from asyncql.models.connection import Connection
 from asyncql.models.database import Database
+from asyncql.models.pipeline import Pipeline
 from asyncql.models.transaction import Transaction
 
 __version__ = "0.2.2"
-__all__ = ["Database", "Connection", "Transaction"]
+__all__ = [
+    "Database",
+    "Connection",
+    "Transaction",
+    "Pipeline",
+    "AdmissionController",
+    "PriorityClass",
+]
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Any
+
+import asyncmy
+from asyncmy.converters import conversions
+from asyncmy.cursors import DictCursor
+
+from asyncql.backends.mysql_base import (
+    BaseMySQLBackend,
+    MySQLConnection,
+    MySQLTransaction,
+)
+from asyncql.exceptions import AsyncqlException
+
+__all__ = ["AsyncmyBackend", "MySQLConnection", "MySQLTransaction"]
+
+
+class AsyncmyBackend(BaseMySQLBackend):
+    _dict_cursor = DictCursor
+    _conversions = conversions
+    _database_option = "database"
+
+    async def _create_pool(self, **options: Any) -> asyncmy.Pool:
+        return await asyncmy.create_pool(**options)
+
+    async def _open_connection(self) -> asyncmy.Connection:
+        if self._pool is None:
+            raise AsyncqlException("Connection not established")
+
+        # same arguments the pool itself opens its connections with
+        return await asyncmy.connect(**self._pool._conn_kwargs)
@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+Converter = Callable[[Any], Any]
+Description = Sequence[Sequence[Any]]
+ColumnPlan = Tuple[Tuple[int, str, Converter, bool], ...]
+
+# mysql protocol field types, shared by every mysql driver
+DECIMAL = 0
+TIMESTAMP = 7
+DATE = 10
+TIME = 11
+DATETIME = 12
+YEAR = 13
+JSON = 245
+NEWDECIMAL = 246
+
+TEMPORAL_TYPES = (TIMESTAMP, DATE, TIME, DATETIME, YEAR)
+
+
+def to_bytes(value: Any) -> Any:
+    # not a passthrough: drivers decode every non-binary field to str before
+    # any converter runs, so this encodes it back (connections always use the
+    # utf8mb4 default charset). it's for callers that need bytes, and costs
+    # an extra step per value over leaving the default str
+    if isinstance(value, str):
+        return value.encode()
+
+    return value
+
+
+class LazyValue:
+    __slots__ = ("_raw", "_converter", "_value", "_decoded")
+
+    def __init__(self, raw: Any, converter: Converter) -> None:
+        self._raw = raw
+        self._converter = converter
+        self._value: Any = None
+        self._decoded = False
+
+    @property
+    def raw(self) -> Any:
+        return self._raw
+
+    def get(self) -> Any:
+        if not self._decoded:
+            self._value = self._converter(self._raw)
+            self._decoded = True
+
+        return self._value
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._raw!r})"
+
+
+class ResultDecoder:
+    def __init__(
+        self,
+        *,
+        types: Optional[Mapping[int, Converter]] = None,
+        columns: Optional[Mapping[str, Converter]] = None,
+        lazy_columns: Iterable[str] = (),
+        bytes_types: Iterable[int] = (),
+        decimal_as_float: bool = False,
+        json_loads: Optional[Callable[[str], Any]] = None,
+    ) -> None:
+        self._types: Dict[int, Converter] = {}
+        if decimal_as_float:
+            self._types[DECIMAL] = float
+            self._types[NEWDECIMAL] = float
+
+        if json_loads is not None:
+            self._types[JSON] = json_loads
+
+        if types is not None:
+            self._types.update(types)
+
+        self._bytes_types = frozenset(bytes_types)
+        self._columns: Dict[str, Converter] = dict(columns or {})
+        self._lazy_columns = frozenset(lazy_columns)
+
+        for column in self._lazy_columns:
+            if column not in self._columns:
+                raise ValueError(f"Lazy column {column} has no converter")
+
+        self._plans: Dict[Tuple[Tuple[str, str, int], ...], ColumnPlan] = {}
+
+    def conversions(self, base: Mapping[Any, Any]) -> Dict[Any, Any]:
+        # base is the driver's full conversion table; its non-int keys are the
+        # encoders used for client-side parameter escaping and are kept as-is
+        conversions = dict(base)
+        conversions.update(self._types)
+
+        for field_type in self._bytes_types:
+            conversions[field_type] = to_bytes
+
+        return conversions
+
+    def plan(
+        self,
+        description: Optional[Description],
+        keys: Optional[Sequence[str]] = None,
+    ) -> ColumnPlan:
+        if not self._columns or not description:
+            return ()
+
+        # dict cursors rename repeated column names to table.column, so the
+        # keys actually produced are tracked next to the column names
+        if keys is None:
+            keys = [column[0] for column in description]
+
+        key = tuple(
+            (row_key, column[0], column[1])
+            for row_key, column in zip(keys, description)
+        )
+        plan = self._plans.get(key)
+        if plan is None:
+            entries: List[Tuple[int, str, Converter, bool]] = []
+            for index, (row_key, name, _) in enumerate(key):
+                # a converter for table.column wins over one for the bare name
+                if row_key in self._columns:
+                    name = row_key
+
+                converter = self._columns.get(name)
+                if converter is None:
+                    continue
+
+                entries.append((index, row_key, converter, name in self._lazy_columns))
+
+            plan = self._plans[key] = tuple(entries)
+
+        return plan
+
+    def decode_dicts(
+        self,
+        rows: List[Dict[str, Any]],
+        description: Optional[Description],
+    ) -> List[Dict[str, Any]]:
+        if not rows:
+            return rows
+
+        plan = self.plan(description, list(rows[0]))
+        if not plan:
+            return rows
+
+        for row in rows:
+            for _, name, converter, lazy in plan:
+                value = row[name]
+                if value is None:
+                    continue
+
+                row[name] = LazyValue(value, converter) if lazy else converter(value)
+
+        return rows
+
+    def decode_tuples(
+        self,
+        rows: Sequence[Sequence[Any]],
+        description: Optional[Description],
+    ) -> Sequence[Sequence[Any]]:
+        plan = self.plan(description)
+        if not plan:
+            return rows
+
+        decoded: List[Sequence[Any]] = []
+        for row in rows:
+            values = list(row)
+            for index, _, converter, lazy in plan:
+                value = values[index]
+                if value is None:
+                    continue
+
+                values[index] = (
+                    LazyValue(value, converter) if lazy else converter(value)
+                )
+
+            decoded.append(values)
+
+        return decoded
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, List, Protocol
+from typing import TYPE_CHECKING, Any, Dict, List, Protocol, Sequence, Tuple
 
 if TYPE_CHECKING:
     from asyncql.backends.models.database import DatabaseBackend
@@ -20,6 +20,12 @@ class BackendConnection(Protocol):
     async def fetch_all(self, query: str) -> List[Dict[str, Any]]:
         ...
 
+    async def fetch_all_tuples(
+        self,
+        query: str,
+    ) -> Tuple[Sequence[str], Sequence[Sequence[Any]]]:
+        ...
+
     async def fetch_one(self, query: str) -> Dict[str, Any]:
         ...
 
@@ -29,6 +35,12 @@ class BackendConnection(Protocol):
     async def execute_many(self, queries: List[str]) -> None:
         ...
 
+    async def execute_pipeline(
+        self,
+        queries: List[str],
+    ) -> List[Tuple[List[Dict[str, Any]], Any]]:
+        ...
+
     def transaction(self) -> BackendTransaction:
         ...
 
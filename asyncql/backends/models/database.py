@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Protocol, Union, runtime_checkable
+from typing import Any, Dict, Protocol, Union, runtime_checkable
 
 from asyncql.backends.models.connection import BackendConnection
 from asyncql.models.url import DatabaseURL
@@ -23,3 +23,6 @@ class DatabaseBackend(Protocol):
 
     def connection(self) -> BackendConnection:
         ...
+
+    def stats(self) -> Dict[str, int]:
+        ...
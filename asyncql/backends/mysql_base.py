@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+from uuid import uuid4
+
+from asyncql.backends.decoding import ResultDecoder
+from asyncql.backends.models.connection import BackendConnection
+from asyncql.backends.models.database import DatabaseBackend
+from asyncql.backends.models.transaction import BackendTransaction
+from asyncql.backends.pool import PoolMaintainer
+from asyncql.common import query as querylib
+from asyncql.exceptions import AsyncqlException, PipelineError
+from asyncql.models.url import DatabaseURL
+
+
+class BaseMySQLBackend(DatabaseBackend):
+    # driver specifics, filled in by each mysql backend
+    _dict_cursor: Any = None
+    _conversions: Mapping[Any, Any] = {}
+    _database_option = "db"
+
+    def __init__(
+        self,
+        database_url: Union[DatabaseURL, str],
+        use_ssl: bool = False,
+        min_size: Optional[int] = None,
+        max_size: Optional[int] = None,
+        decoder: Optional[ResultDecoder] = None,
+        warm_up: Optional[int] = None,
+        max_idle: Optional[float] = None,
+        max_lifetime: Optional[float] = None,
+        health_check_interval: Optional[float] = None,
+        health_check_idle: float = 30.0,
+    ) -> None:
+        if isinstance(database_url, str):
+            database_url = DatabaseURL(database_url)
+
+        self._database_url = database_url
+        self._use_ssl = use_ssl
+        self._min_size = min_size
+        self._max_size = max_size
+        self._decoder = decoder
+        self._warm_up = warm_up
+        self._max_idle = max_idle
+        self._max_lifetime = max_lifetime
+        self._health_check_interval = health_check_interval
+        self._health_check_idle = health_check_idle
+        self._pool: Optional[Any] = None
+        self._maintainer: Optional[PoolMaintainer] = None
+
+    @property
+    def _connection_options(self) -> Dict[str, Any]:
+        options: Dict[str, Any] = {}
+
+        for option_name, option_value in (
+            ("ssl", self._use_ssl),
+            ("minsize", self._min_size),
+            ("maxsize", self._max_size),
+        ):
+            if option_value is not None:
+                options[option_name] = option_value
+
+        # drivers disagree on the default, so it's always disabled explicitly:
+        # the pool would recycle inside acquire(), max_idle is enforced by the
+        # maintainer instead
+        options["pool_recycle"] = -1
+
+        if self._decoder is not None:
+            options["conv"] = self._decoder.conversions(self._conversions)
+
+        return options
+
+    async def connect(self) -> None:
+        if self._pool is not None:
+            raise AsyncqlException("Connection already established")
+
+        port = 3306
+        if self._database_url.port is not None:
+            port = self._database_url.port
+
+        self._pool = await self._create_pool(
+            host=self._database_url.host,
+            port=port,
+            user=self._database_url.username,
+            password=self._database_url.password,
+            autocommit=True,
+            **{self._database_option: self._database_url.database},
+            **self._connection_options,
+        )
+
+        # idle connections are only pinged when health checks are asked for,
+        # the limits alone get a check interval of their own
+        check_interval = self._health_check_interval
+        idle_threshold = None
+        if check_interval is not None:
+            idle_threshold = self._health_check_idle
+        else:
+            limits = [
+                limit
+                for limit in (self._max_idle, self._max_lifetime)
+                if limit is not None
+            ]
+            if limits:
+                check_interval = min(limits) / 2
+
+        if self._warm_up or check_interval is not None:
+            self._maintainer = PoolMaintainer(
+                self._pool,
+                self._open_connection,
+                warm_up=self._warm_up,
+                check_interval=check_interval,
+                idle_threshold=idle_threshold,
+                max_idle=self._max_idle,
+                max_lifetime=self._max_lifetime,
+            )
+
+            try:
+                await self._maintainer.start()
+            except BaseException as exc:
+                self._maintainer = None
+                self._pool.close()
+                await self._pool.wait_closed()
+                self._pool = None
+                raise exc
+
+    async def _create_pool(self, **options: Any) -> Any:
+        raise NotImplementedError()
+
+    async def _open_connection(self) -> Any:
+        raise NotImplementedError()
+
+    async def disconnect(self) -> None:
+        if self._pool is None:
+            raise AsyncqlException("Connection not established")
+
+        if self._maintainer is not None:
+            await self._maintainer.stop()
+            self._maintainer = None
+
+        self._pool.close()
+        await self._pool.wait_closed()
+        self._pool = None
+
+    def connection(self) -> MySQLConnection:
+        return MySQLConnection(self)
+
+    def stats(self) -> Dict[str, int]:
+        if self._pool is None:
+            return {"size": 0, "free": 0, "min_size": 0, "max_size": 0}
+
+        return {
+            "size": self._pool.size,
+            "free": self._pool.freesize,
+            "min_size": self._pool.minsize,
+            "max_size": self._pool.maxsize,
+        }
+
+
+class MySQLConnection(BackendConnection):
+    def __init__(self, database: BaseMySQLBackend) -> None:
+        self._database = database
+        self._connection: Optional[Any] = None
+
+    async def acquire(self) -> None:
+        if self._connection is not None:
+            raise AsyncqlException("Connection already acquired")
+
+        if self._database._pool is None:
+            raise AsyncqlException("Connection not established")
+
+        self._connection = await self._database._pool.acquire()
+
+    async def release(self) -> None:
+        if self._connection is None:
+            raise AsyncqlException("Connection not acquired")
+
+        if self._database._pool is None:
+            raise AsyncqlException("Connection not established")
+
+        await self._database._pool.release(self._connection)
+        self._connection = None
+
+    async def fetch_all(self, query: str) -> List[Dict[str, Any]]:
+        if self._connection is None:
+            raise AsyncqlException("Connection not acquired")
+
+        async with self._connection.cursor(self._database._dict_cursor) as cursor:
+            await cursor.execute(query)
+            rows = await cursor.fetchall()
+
+            if self._database._decoder is not None:
+                rows = self._database._decoder.decode_dicts(rows, cursor.description)
+
+        return rows
+
+    async def fetch_all_tuples(
+        self,
+        query: str,
+    ) -> Tuple[Sequence[str], Sequence[Sequence[Any]]]:
+        if self._connection is None:
+            raise AsyncqlException("Connection not acquired")
+
+        async with self._connection.cursor() as cursor:
+            await cursor.execute(query)
+            rows = await cursor.fetchall()
+
+            description = cursor.description or ()
+            if self._database._decoder is not None:
+                rows = self._database._decoder.decode_tuples(rows, description)
+
+        return [column[0] for column in description], rows
+
+    async def fetch_one(self, query: str) -> Dict[str, Any]:
+        if self._connection is None:
+            raise AsyncqlException("Connection not acquired")
+
+        async with self._connection.cursor(self._database._dict_cursor) as cursor:
+            await cursor.execute(query)
+            row = await cursor.fetchone()
+
+            if row is not None and self._database._decoder is not None:
+                (row,) = self._database._decoder.decode_dicts([row], cursor.description)
+
+        return row
+
+    async def execute(self, query: str) -> int:
+        if self._connection is None:
+            raise AsyncqlException("Connection not acquired")
+
+        async with self._connection.cursor(self._database._dict_cursor) as cursor:
+            await cursor.execute(query)
+            return cursor.lastrowid
+
+    async def execute_many(self, queries: List[str]) -> None:
+        if self._connection is None:
+            raise AsyncqlException("Connection not acquired")
+
+        async with self._connection.cursor(self._database._dict_cursor) as cursor:
+            for query in queries:
+                await cursor.execute(query)
+
+    async def execute_pipeline(
+        self,
+        queries: List[str],
+    ) -> List[Tuple[List[Dict[str, Any]], Any]]:
+        if self._connection is None:
+            raise AsyncqlException("Connection not acquired")
+
+        # both drivers always negotiate multi-statement support, so the whole
+        # batch goes out as one packet and each statement gets a result set;
+        # separators go on their own line so a trailing -- or # comment can't
+        # swallow them
+        statement = "\n;\n".join(querylib.strip_terminator(query) for query in queries)
+
+        results: List[Tuple[List[Dict[str, Any]], Any]] = []
+        async with self._connection.cursor(self._database._dict_cursor) as cursor:
+            try:
+                await cursor.execute(statement)
+
+                while True:
+                    rows = list(await cursor.fetchall())
+                    if self._database._decoder is not None:
+                        rows = self._database._decoder.decode_dicts(
+                            rows,
+                            cursor.description,
+                        )
+
+                    results.append((rows, cursor.lastrowid))
+                    if len(results) == len(queries) or not await cursor.nextset():
+                        break
+            except Exception as exc:
+                raise PipelineError(len(results), exc, results) from exc
+
+        return results
+
+    def transaction(self) -> BackendTransaction:
+        return MySQLTransaction(self)
+
+    @property
+    def raw_connection(self) -> Any:
+        if self._connection is None:
+            raise AsyncqlException("Connection not acquired")
+
+        return self._connection
+
+
+class MySQLTransaction(BackendTransaction):
+    def __init__(self, connection: MySQLConnection) -> None:
+        self._connection = connection
+        self._is_root = False
+        self._savepoint_name: Optional[str] = None
+
+    async def start(self, is_root: bool = False) -> None:
+        if self._connection._connection is None:
+            raise AsyncqlException("Connection not acquired")
+
+        connection = self._connection._connection
+
+        self._is_root = is_root
+        if self._is_root:
+            await connection.begin()
+        else:
+            self._savepoint_name = "asyncql_" + str(uuid4()).replace("-", "_")
+            async with connection.cursor() as cursor:
+                await cursor.execute(f"SAVEPOINT {self._savepoint_name}")
+
+    async def commit(self) -> None:
+        if self._connection._connection is None:
+            raise AsyncqlException("Connection not acquired")
+
+        connection = self._connection._connection
+
+        if self._is_root:
+            await connection.commit()
+        else:
+            async with connection.cursor() as cursor:
+                await cursor.execute(f"RELEASE SAVEPOINT {self._savepoint_name}")
+
+    async def rollback(self) -> None:
+        if self._connection._connection is None:
+            raise AsyncqlException("Connection not acquired")
+
+        connection = self._connection._connection
+
+        if self._is_root:
+            await connection.rollback()
+        else:
+            async with connection.cursor() as cursor:
+                await cursor.execute(f"ROLLBACK TO SAVEPOINT {self._savepoint_name}")
@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from typing import Any, Awaitable, Callable, List, MutableMapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class PoolMaintainer:
+    # works against the aiomysql-style pool internals (_free, _used,
+    # _acquiring, _cond) so the hot acquire path stays untouched
+    def __init__(
+        self,
+        pool: Any,
+        connect: Callable[[], Awaitable[Any]],
+        *,
+        warm_up: Optional[int] = None,
+        check_interval: Optional[float] = None,
+        idle_threshold: Optional[float] = None,
+        max_idle: Optional[float] = None,
+        max_lifetime: Optional[float] = None,
+    ) -> None:
+        self._pool = pool
+        self._connect = connect
+        self._warm_up = warm_up
+        self._check_interval = check_interval
+        self._idle_threshold = idle_threshold
+        self._max_idle = max_idle
+        self._max_lifetime = max_lifetime
+
+        self._created_at: MutableMapping[Any, float] = weakref.WeakKeyDictionary()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def start(self) -> None:
+        if self._warm_up:
+            await self.warm_up(self._warm_up)
+
+        if self._check_interval is not None:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+        self._task = None
+
+    async def warm_up(self, target: int) -> None:
+        pool = self._pool
+        if pool.maxsize:
+            target = min(target, pool.maxsize)
+
+        missing = target - pool.size
+        if missing <= 0:
+            return
+
+        # pending connections count towards the pool size so the pool itself
+        # doesn't open extra ones while these are being established
+        pool._acquiring += missing
+        try:
+            results = await asyncio.gather(
+                *(self._connect() for _ in range(missing)),
+                return_exceptions=True,
+            )
+        finally:
+            pool._acquiring -= missing
+
+        connections: List[Any] = []
+        errors: List[BaseException] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                errors.append(result)
+            else:
+                connections.append(result)
+
+        now = asyncio.get_running_loop().time()
+        for connection in connections:
+            self._created_at[connection] = now
+
+        async with pool._cond:
+            if pool._closing:
+                for connection in connections:
+                    connection.close()
+            else:
+                pool._free.extend(connections)
+                pool._cond.notify(len(connections))
+
+        if errors:
+            raise errors[0]
+
+    async def check(self) -> None:
+        pool = self._pool
+        now = asyncio.get_running_loop().time()
+
+        # warmed up connections are stamped when opened; the ones the pool
+        # opens itself are first seen here, in use or free, so their lifetime
+        # is counted up to one check interval late
+        for connection in pool._used:
+            self._created_at.setdefault(connection, now)
+
+        checked = recycled = False
+        for connection in list(pool._free):
+            created_at = self._created_at.setdefault(connection, now)
+            idle_for = now - connection.last_usage
+            expired = (
+                self._max_lifetime is not None and now - created_at > self._max_lifetime
+            ) or (self._max_idle is not None and idle_for > self._max_idle)
+            idle = self._idle_threshold is not None and idle_for > self._idle_threshold
+            if not expired and not idle:
+                continue
+
+            # the free list is only touched under the pool's condition, as the
+            # pool walks it by index across awaits while filling it; the
+            # connection is checked out so it can't be handed to a caller
+            # while it's being pinged, without shrinking the pool size
+            async with pool._cond:
+                # the snapshot goes stale across the pings below
+                if connection not in pool._free:
+                    continue
+
+                pool._free.remove(connection)
+                pool._used.add(connection)
+
+            checked = True
+
+            healthy = False
+            try:
+                if not expired:
+                    await connection.ping(reconnect=False)
+                    healthy = True
+            except Exception:
+                pass
+            finally:
+                async with pool._cond:
+                    pool._used.discard(connection)
+
+                    if healthy and not pool._closing:
+                        pool._free.append(connection)
+                    else:
+                        connection.close()
+                        recycled = True
+
+        if not checked:
+            return
+
+        async with pool._cond:
+            pool._cond.notify_all()
+
+        if recycled and self._warm_up:
+            await self.warm_up(self._warm_up)
+
+    async def _run(self) -> None:
+        assert self._check_interval is not None
+
+        while True:
+            await asyncio.sleep(self._check_interval)
+
+            try:
+                await self.check()
+            except Exception:
+                logger.exception("Connection pool health check failed")
@@ -0,0 +1,30 @@
+import asyncio
+import sys
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+# try_acquire relies on asyncio.Lock's private _locked and _waiters, which
+# have been checked on 3.7 through 3.13; other versions always await acquire()
+SYNC_ACQUIRE = (3, 7) <= sys.version_info[:2] <= (3, 13)
+
+
+class Lock(asyncio.Lock):
+    # even an uncontended asyncio.Lock costs a coroutine round trip per use,
+    # so the lock is taken synchronously and acquire() is only awaited when
+    # another task actually holds or waits for it
+    def try_acquire(self) -> bool:
+        if not SYNC_ACQUIRE or self._locked or self._waiters:  # type: ignore
+            return False
+
+        self._locked = True
+        return True
+
+    async def run(self, func: Callable[..., Awaitable[T]], *args: Any) -> T:
+        if not self.try_acquire():
+            await self.acquire()
+
+        try:
+            return await func(*args)
+        finally:
+            self.release()
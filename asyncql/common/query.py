@@ -1,5 +1,10 @@
+import datetime
+import decimal
+import functools
+import re
+import uuid
 from enum import Enum
-from typing import Any, Mapping, Sequence
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Sequence, Tuple
 
 TABLE = str.maketrans(
     {
@@ -17,40 +22,267 @@ TABLE = str.maketrans(
     }
 )
 
+ESCAPED = re.compile(f"[{re.escape(''.join(map(chr, TABLE)))}]")
+
+# homogeneous string sequences are joined on a control character and escaped
+# in one pass, rather than escaping and quoting every element separately
+SEPARATOR = "\x01"
+QUOTED_SEPARATOR = "','"
+
+PARAMETER = re.compile(r":(\w+)")
+
+# everything a statement separator can hide in: quoted strings and
+# identifiers, and comments
+STATEMENT_TOKEN = re.compile(
+    r"""'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`"""
+    r"|--(?:[ \t][^\n]*)?(?=\n|\Z)|#[^\n]*|/\*.*?\*/|;",
+    re.S,
+)
+
+Encoder = Callable[[Any, List[str]], None]
+
 
 def _sanitize_str(value: str) -> str:
     return value.translate(TABLE)
 
 
+def _encode_str(value: str, out: List[str]) -> None:
+    out.append(f"'{value.translate(TABLE)}'")
+
+
+def _encode_bool(value: bool, out: List[str]) -> None:
+    out.append("true" if value else "false")
+
+
+def _encode_int(value: int, out: List[str]) -> None:
+    out.append(int.__repr__(value))
+
+
+def _encode_float(value: float, out: List[str]) -> None:
+    out.append(float.__repr__(value))
+
+
+def _encode_none(value: None, out: List[str]) -> None:
+    out.append("NULL")
+
+
+def _encode_bytes(value: bytes, out: List[str]) -> None:
+    out.append(f"X'{bytes(value).hex()}'")
+
+
+def _encode_decimal(value: decimal.Decimal, out: List[str]) -> None:
+    out.append(format(value, "f"))
+
+
+def _encode_datetime(value: datetime.datetime, out: List[str]) -> None:
+    out.append(f"'{value.isoformat(' ')}'")
+
+
+def _encode_isoformat(value: Any, out: List[str]) -> None:
+    out.append(f"'{value.isoformat()}'")
+
+
+def _encode_timedelta(value: datetime.timedelta, out: List[str]) -> None:
+    sign = "-" if value < datetime.timedelta(0) else ""
+    value = abs(value)
+
+    minutes, seconds = divmod(value.seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    hours += value.days * 24
+
+    fraction = f".{value.microseconds:06}" if value.microseconds else ""
+    out.append(f"'{sign}{hours}:{minutes:02}:{seconds:02}{fraction}'")
+
+
+def _encode_uuid(value: uuid.UUID, out: List[str]) -> None:
+    out.append(f"'{value}'")
+
+
+def _encode_enum(value: Enum, out: List[str]) -> None:
+    enum_value = value.value
+    _encoder(type(enum_value))(enum_value, out)
+
+
+def _encode_tolist(value: Any, out: List[str]) -> None:
+    # numpy arrays and scalars convert to python objects in C
+    converted = value.tolist()
+    _encoder(type(converted))(converted, out)
+
+
+def _encode_sequence(value: Sequence[Any], out: List[str]) -> None:
+    if not isinstance(value, (list, tuple)):
+        value = list(value)
+
+    value_types = set(map(type, value))
+    if len(value_types) == 1:
+        (value_type,) = value_types
+
+        if value_type is int:
+            out.append(f"({','.join(map(int.__repr__, value))})")
+            return
+
+        if value_type is str:
+            joined = SEPARATOR.join(value)
+            if joined.count(SEPARATOR) == len(value) - 1:
+                if ESCAPED.search(joined) is not None:
+                    joined = joined.translate(TABLE)
+
+                out.append(f"('{joined.replace(SEPARATOR, QUOTED_SEPARATOR)}')")
+                return
+
+        if value_type is float:
+            out.append(f"({','.join(map(float.__repr__, value))})")
+            return
+
+    out.append("(")
+    for index, item in enumerate(value):
+        if index:
+            out.append(",")
+
+        _encoder(type(item))(item, out)
+
+    out.append(")")
+
+
+def _encode_fallback(value: Any, out: List[str]) -> None:
+    out.append(_sanitize_str(str(value)))
+
+
+ENCODERS: Dict[type, Encoder] = {
+    str: _encode_str,
+    bool: _encode_bool,
+    int: _encode_int,
+    float: _encode_float,
+    type(None): _encode_none,
+    bytes: _encode_bytes,
+    bytearray: _encode_bytes,
+    memoryview: _encode_bytes,
+    decimal.Decimal: _encode_decimal,
+    datetime.datetime: _encode_datetime,
+    datetime.date: _encode_isoformat,
+    datetime.time: _encode_isoformat,
+    datetime.timedelta: _encode_timedelta,
+    uuid.UUID: _encode_uuid,
+    list: _encode_sequence,
+    tuple: _encode_sequence,
+    set: _encode_sequence,
+    frozenset: _encode_sequence,
+}
+
+
+def _resolve_encoder(value_type: type) -> Encoder:
+    # enums are checked first so int and str mixins encode their value
+    if issubclass(value_type, Enum):
+        return _encode_enum
+
+    for base in value_type.__mro__[1:]:
+        encoder = ENCODERS.get(base)
+        if encoder is not None:
+            return encoder
+
+    if value_type.__module__.split(".")[0] == "numpy" and hasattr(value_type, "tolist"):
+        return _encode_tolist
+
+    if issubclass(value_type, Sequence):
+        return _encode_sequence
+
+    return _encode_fallback
+
+
+def _encoder(value_type: type) -> Encoder:
+    encoder = ENCODERS.get(value_type)
+    if encoder is None:
+        encoder = ENCODERS[value_type] = _resolve_encoder(value_type)
+
+    return encoder
+
+
 def _sanitize_value(value: Any) -> str:
-    if isinstance(value, str):
-        sanitized = _sanitize_str(value)
-        value = f"'{sanitized}'"
-    elif isinstance(value, bool):
-        value = str(value).lower()
-    elif isinstance(value, Enum):
-        enum_value = value.value
-        value = _sanitize_value(enum_value)
-    elif isinstance(value, Sequence):
-        sanitized_sequence = [_sanitize_value(v) for v in value]
-        value = f"({','.join(sanitized_sequence)})"
-    elif value is None:
-        value = "NULL"
-    else:
-        value = _sanitize_str(str(value))
-
-    return value
+    out: List[str] = []
+    _encoder(type(value))(value, out)
+    return "".join(out)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_query(
+    query: str,
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], FrozenSet[str]]:
+    parts = PARAMETER.split(query)
+    names = tuple(parts[1::2])
+    return tuple(parts[0::2]), names, frozenset(names)
 
 
 def parse_query(query: str, params: Mapping[str, Any]) -> str:
-    for key, value in params.items():
-        query_key = f":{key}"
-        key_position = query.index(query_key)
+    texts, names, known = _compile_query(query)
+
+    # a parameter the query doesn't use is a mistake, while a :name without a
+    # parameter is left as is, as it may well be part of a literal
+    if not known.issuperset(params):
+        unknown = ", ".join(sorted(set(params) - known))
+        raise ValueError(f"Parameters not found in query: {unknown}")
+
+    if not names:
+        return query
+
+    out = [texts[0]]
+    for name, text in zip(names, texts[1:]):
+        if name in params:
+            value = params[name]
+            _encoder(type(value))(value, out)
+        else:
+            out.append(f":{name}")
+
+        out.append(text)
+
+    return "".join(out)
+
+
+def count_statements(query: str) -> int:
+    statements = 0
+    pending = False
+    position = 0
+
+    for match in STATEMENT_TOKEN.finditer(query):
+        token = match.group()
+        if query[position : match.start()].strip() or token[0] in "'\"`":
+            pending = True
+
+        if token == ";" and pending:
+            statements += 1
+            pending = False
+
+        position = match.end()
+
+    if pending or query[position:].strip():
+        statements += 1
+
+    return statements
+
+
+def strip_terminator(query: str) -> str:
+    # drops the ; ending a statement, including ones followed by comments, so
+    # statements can be joined without producing an empty one in between
+    terminators: List[int] = []
+    position = 0
+
+    for match in STATEMENT_TOKEN.finditer(query):
+        token = match.group()
+        if query[position : match.start()].strip() or token[0] in "'\"`":
+            terminators = []
+
+        if token == ";":
+            terminators.append(match.start())
+
+        position = match.end()
+
+    if not terminators or query[position:].strip():
+        return query.strip()
 
-        key_placement = key_position + len(query_key)
-        query = (
-            query[:key_placement].replace(query_key, _sanitize_value(value))
-            + query[key_placement:]
-        )
+    parts = []
+    position = 0
+    for index in terminators:
+        parts.append(query[position:index])
+        position = index + 1
 
-    return query
+    parts.append(query[position:])
+    return "".join(parts).strip()
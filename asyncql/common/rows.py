@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import dataclasses
+import functools
+import inspect
+import keyword
+from typing import Any, Callable, Dict, List, Sequence, Tuple, Type, TypeVar, cast
+
+T = TypeVar("T")
+
+
+def _slots(target: type) -> List[str]:
+    slots: List[str] = []
+    for klass in reversed(target.__mro__):
+        klass_slots = klass.__dict__.get("__slots__", ())
+        if isinstance(klass_slots, str):
+            klass_slots = (klass_slots,)
+
+        slots.extend(
+            slot for slot in klass_slots if slot not in ("__dict__", "__weakref__")
+        )
+
+    return slots
+
+
+def _compile(source: str, namespace: Dict[str, Any]) -> Callable[..., Any]:
+    exec(source, namespace)
+    return namespace["make_row"]
+
+
+def _signature_factory(
+    columns: Tuple[str, ...],
+    target: type,
+) -> Callable[[Sequence[Any]], Any]:
+    indexes = {column: index for index, column in enumerate(columns)}
+    parameters = inspect.signature(target).parameters.values()
+
+    # arguments are passed positionally until the first skipped parameter,
+    # which is cheaper to bind than keywords
+    positional: List[str] = []
+    keywords: List[str] = []
+    skipped = False
+    var_keyword = False
+    for parameter in parameters:
+        if parameter.kind in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
+            var_keyword = var_keyword or parameter.kind is parameter.VAR_KEYWORD
+            skipped = True
+            continue
+
+        index = indexes.get(parameter.name)
+        if index is None:
+            if parameter.default is parameter.empty:
+                raise TypeError(
+                    f"Column {parameter.name} required by {target.__name__} "
+                    "is missing from the result set",
+                )
+
+            skipped = True
+            continue
+
+        if parameter.kind is parameter.POSITIONAL_ONLY and skipped:
+            raise TypeError(
+                f"Column {parameter.name} can't be passed to {target.__name__}: "
+                "it is positional-only and follows a parameter missing from "
+                "the result set",
+            )
+
+        if parameter.kind is parameter.POSITIONAL_ONLY or (
+            parameter.kind is parameter.POSITIONAL_OR_KEYWORD and not skipped
+        ):
+            positional.append(f"row[{index}]")
+        else:
+            keywords.append(f"{parameter.name}=row[{index}]")
+
+    # a **kwargs target takes every column no named parameter consumed
+    if var_keyword:
+        named = {
+            parameter.name
+            for parameter in parameters
+            if parameter.kind not in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+        }
+        extra: List[str] = []
+        for column, index in indexes.items():
+            if column in named:
+                continue
+
+            if column.isidentifier() and not keyword.iskeyword(column):
+                keywords.append(f"{column}=row[{index}]")
+            else:
+                extra.append(f"{column!r}: row[{index}]")
+
+        if extra:
+            keywords.append(f"**{{{', '.join(extra)}}}")
+
+    arguments = ", ".join(positional + keywords)
+    return _compile(
+        f"def make_row(row):\n    return target({arguments})\n",
+        {"target": target},
+    )
+
+
+def _slots_factory(
+    columns: Tuple[str, ...],
+    target: type,
+) -> Callable[[Sequence[Any]], Any]:
+    indexes = {column: index for index, column in enumerate(columns)}
+
+    lines = ["def make_row(row):", "    instance = new(target)"]
+    for slot in _slots(target):
+        index = indexes.get(slot)
+        if index is not None:
+            lines.append(f"    setattr(instance, {slot!r}, row[{index}])")
+
+    lines.append("    return instance")
+    return _compile(
+        "\n".join(lines) + "\n",
+        {"target": target, "new": object.__new__, "setattr": object.__setattr__},
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def row_factory(
+    columns: Tuple[str, ...],
+    target: type,
+) -> Callable[[Sequence[Any]], Any]:
+    if len(set(columns)) != len(columns):
+        raise TypeError(f"Result set has duplicate column names: {columns}")
+
+    # slotted classes without their own constructor are filled in directly,
+    # everything else (dataclasses, namedtuples, plain classes) goes through
+    # the constructor's signature
+    if (
+        not dataclasses.is_dataclass(target)
+        and getattr(target, "__init__") is object.__init__
+        and getattr(target, "__new__") is object.__new__
+        and _slots(target)
+    ):
+        return _slots_factory(columns, target)
+
+    return _signature_factory(columns, target)
+
+
+def map_rows(
+    columns: Sequence[str],
+    rows: Sequence[Sequence[Any]],
+    target: Type[T],
+) -> List[T]:
+    make_row = row_factory(tuple(columns), cast(type, target))
+    return list(map(make_row, rows))
@@ -1,2 +1,19 @@
+from typing import Any, List, Tuple
+
+
 class AsyncqlException(Exception):
     pass
+
+
+class PipelineError(AsyncqlException):
+    def __init__(
+        self,
+        index: int,
+        error: BaseException,
+        results: List[Tuple[List[Any], Any]],
+    ) -> None:
+        super().__init__(f"Pipelined statement {index} failed: {error}")
+
+        self.index = index
+        self.error = error
+        self.results = results
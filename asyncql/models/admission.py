@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Mapping, Optional
+
+
+class PriorityClass:
+    def __init__(
+        self,
+        weight: int = 1,
+        limit: Optional[int] = None,
+        reserved: int = 0,
+    ) -> None:
+        if weight < 1:
+            raise ValueError("Priority weight must be at least 1")
+
+        if limit is not None and limit < 1:
+            raise ValueError("Priority limit must be at least 1")
+
+        if reserved < 0 or (limit is not None and reserved > limit):
+            raise ValueError("Priority reservation must be between 0 and its limit")
+
+        self.weight = weight
+        self.limit = limit
+        self.reserved = reserved
+
+
+class PriorityStats:
+    def __init__(self) -> None:
+        self.waiting = 0
+        self.active = 0
+        self.admitted = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+
+    @property
+    def average_wait_time(self) -> float:
+        if not self.admitted:
+            return 0.0
+
+        return self.total_wait_time / self.admitted
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(waiting={self.waiting}, "
+            f"active={self.active}, admitted={self.admitted}, "
+            f"average_wait_time={self.average_wait_time:.6f}, "
+            f"max_wait_time={self.max_wait_time:.6f})"
+        )
+
+
+class _PriorityState:
+    def __init__(self, priority: PriorityClass) -> None:
+        self.priority = priority
+        self.waiters: Deque[asyncio.Future[None]] = deque()
+        self.active = 0
+        self.admitted = 0
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.virtual_time = 0.0
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        capacity: int,
+        classes: Mapping[str, PriorityClass],
+        default: Optional[str] = None,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("Admission capacity must be at least 1")
+
+        if not classes:
+            raise ValueError("At least one priority class is required")
+
+        if sum(priority.reserved for priority in classes.values()) > capacity:
+            raise ValueError("Reserved connections exceed admission capacity")
+
+        if default is None:
+            default = next(iter(classes))
+        elif default not in classes:
+            raise ValueError(f"Unknown default priority: {default}")
+
+        self._capacity = capacity
+        self._classes = dict(classes)
+        self._default = default
+
+        self._states = {
+            name: _PriorityState(priority) for name, priority in classes.items()
+        }
+        self._active = 0
+        self._waiting = 0
+        self._virtual_time = 0.0
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def default(self) -> str:
+        return self._default
+
+    def copy(self, capacity: Optional[int] = None) -> AdmissionController:
+        if capacity is None:
+            capacity = self._capacity
+
+        return AdmissionController(capacity, self._classes, self._default)
+
+    def _state(self, priority: Optional[str]) -> _PriorityState:
+        if priority is None:
+            priority = self._default
+
+        try:
+            return self._states[priority]
+        except KeyError:
+            raise ValueError(f"Unknown priority: {priority}") from None
+
+    def _can_admit(self, state: _PriorityState) -> bool:
+        if self._active >= self._capacity:
+            return False
+
+        limit = state.priority.limit
+        if limit is not None and state.active >= limit:
+            return False
+
+        # a slot may only be handed out if every other class can still claim
+        # the part of its reservation it isn't using yet
+        owed = sum(
+            other.priority.reserved - other.active
+            for other in self._states.values()
+            if other is not state and other.active < other.priority.reserved
+        )
+        return self._capacity - self._active - 1 >= owed
+
+    def _admit(self, state: _PriorityState) -> None:
+        state.active += 1
+        self._active += 1
+
+    def _dispatch(self) -> None:
+        while self._waiting:
+            candidate: Optional[_PriorityState] = None
+            for state in self._states.values():
+                while state.waiters and state.waiters[0].done():
+                    state.waiters.popleft()
+                    self._waiting -= 1
+
+                if not state.waiters or not self._can_admit(state):
+                    continue
+
+                if candidate is None or state.virtual_time < candidate.virtual_time:
+                    candidate = state
+
+            if candidate is None:
+                return
+
+            waiter = candidate.waiters.popleft()
+            self._waiting -= 1
+
+            # stride scheduling: only admissions under contention advance the
+            # class' virtual time, inversely to its weight, and the lowest
+            # virtual time goes next
+            self._virtual_time = candidate.virtual_time
+            candidate.virtual_time += 1 / candidate.priority.weight
+
+            self._admit(candidate)
+            waiter.set_result(None)
+
+    async def acquire(self, priority: Optional[str] = None) -> str:
+        state = self._state(priority)
+        name = priority if priority is not None else self._default
+
+        if not self._waiting and self._can_admit(state):
+            self._admit(state)
+            state.admitted += 1
+            return name
+
+        loop = asyncio.get_running_loop()
+        waiter: asyncio.Future[None] = loop.create_future()
+
+        # an idle class rejoins level with the classes already queued instead
+        # of spending credit it built up while it had nothing queued
+        if not state.waiters:
+            backlogged = [
+                other.virtual_time for other in self._states.values() if other.waiters
+            ]
+            state.virtual_time = max(
+                state.virtual_time,
+                min(backlogged, default=self._virtual_time),
+            )
+
+        state.waiters.append(waiter)
+        self._waiting += 1
+
+        started_at = loop.time()
+        try:
+            self._dispatch()
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(name)
+            else:
+                try:
+                    state.waiters.remove(waiter)
+                    self._waiting -= 1
+                except ValueError:
+                    pass
+
+            raise
+
+        wait_time = loop.time() - started_at
+        state.admitted += 1
+        state.total_wait_time += wait_time
+        state.max_wait_time = max(state.max_wait_time, wait_time)
+
+        return name
+
+    def release(self, priority: Optional[str] = None) -> None:
+        state = self._state(priority)
+        if not state.active:
+            raise RuntimeError("Priority has no active connections")
+
+        state.active -= 1
+        self._active -= 1
+        self._dispatch()
+
+    def stats(self) -> Dict[str, PriorityStats]:
+        stats = {}
+        for name, state in self._states.items():
+            priority_stats = PriorityStats()
+            priority_stats.waiting = sum(
+                1 for waiter in state.waiters if not waiter.done()
+            )
+            priority_stats.active = state.active
+            priority_stats.admitted = state.admitted
+            priority_stats.total_wait_time = state.total_wait_time
+            priority_stats.max_wait_time = state.max_wait_time
+
+            stats[name] = priority_stats
+
+        return stats
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+from types import TracebackType
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+ChunkFetcher = Callable[[str, Mapping[str, Any]], Awaitable[List[Dict[str, Any]]]]
+
+
+def _column_name(key: str) -> str:
+    return key.rpartition(".")[2].strip("`")
+
+
+class ChunkIterator:
+    def __init__(
+        self,
+        fetcher: ChunkFetcher,
+        table_or_query: str,
+        key: Union[str, Sequence[str]],
+        chunk_size: int,
+        params: Optional[Mapping[str, Any]] = None,
+        start_after: Optional[Sequence[Any]] = None,
+    ) -> None:
+        # set first, __del__ runs even when validation below fails
+        self._pending: Optional[asyncio.Future[List[Dict[str, Any]]]] = None
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be at least 1")
+
+        self._fetcher = fetcher
+        self._keys = (key,) if isinstance(key, str) else tuple(key)
+        if not self._keys:
+            raise ValueError("At least one key column is required")
+
+        self._columns = tuple(_column_name(key) for key in self._keys)
+        self._chunk_size = chunk_size
+        self._params = dict(params or {})
+
+        self.chunks = 0
+        self.rows = 0
+        self.last_key: Optional[Tuple[Any, ...]] = None
+        if start_after is not None:
+            if len(start_after) != len(self._keys):
+                raise ValueError("start_after must have a value for every key")
+
+            self.last_key = tuple(start_after)
+
+        source = table_or_query.strip()
+        if len(source.split()) == 1:
+            source = f"SELECT * FROM {source}"
+            keys = self._keys
+        else:
+            # outside the derived table only its own column names exist, so
+            # qualified keys like t.id are referred to by the bare column
+            source = f"SELECT * FROM ({source}) AS asyncql_chunks"
+            keys = tuple(f"`{column}`" for column in self._columns)
+
+        placeholders = [f":asyncql_after_{index}" for index in range(len(keys))]
+        if len(keys) == 1:
+            condition = f"{keys[0]} > {placeholders[0]}"
+        else:
+            condition = f"({', '.join(keys)}) > ({', '.join(placeholders)})"
+
+        order = f"ORDER BY {', '.join(keys)} LIMIT {chunk_size}"
+        self._first_query = f"{source} {order}"
+        self._next_query = f"{source} WHERE {condition} {order}"
+
+        self._exhausted = False
+
+    def _fetch(self) -> asyncio.Future[List[Dict[str, Any]]]:
+        if self.last_key is None:
+            return asyncio.ensure_future(self._fetcher(self._first_query, self._params))
+
+        params = dict(self._params)
+        for index, value in enumerate(self.last_key):
+            params[f"asyncql_after_{index}"] = value
+
+        return asyncio.ensure_future(self._fetcher(self._next_query, params))
+
+    def __aiter__(self) -> ChunkIterator:
+        return self
+
+    async def __anext__(self) -> List[Dict[str, Any]]:
+        if self._pending is None:
+            if self._exhausted:
+                raise StopAsyncIteration
+
+            self._pending = self._fetch()
+
+        try:
+            rows = await self._pending
+        finally:
+            self._pending = None
+
+        if not rows:
+            self._exhausted = True
+            raise StopAsyncIteration
+
+        self.chunks += 1
+        self.rows += len(rows)
+        self.last_key = tuple(rows[-1][column] for column in self._columns)
+
+        # the next chunk is fetched while the caller processes this one
+        if len(rows) < self._chunk_size:
+            self._exhausted = True
+        else:
+            self._pending = self._fetch()
+
+        return rows
+
+    async def aclose(self) -> None:
+        self._exhausted = True
+
+        if self._pending is not None:
+            self._pending.cancel()
+
+            try:
+                await self._pending
+            except (asyncio.CancelledError, Exception):
+                pass
+
+            self._pending = None
+
+    def __del__(self) -> None:
+        # an iterator abandoned mid-scan (a break out of async for outside
+        # async with) must not leave its prefetch running
+        pending = self._pending
+        if pending is None or pending.get_loop().is_closed():
+            return
+
+        if not pending.done():
+            pending.cancel()
+        elif not pending.cancelled():
+            pending.exception()
+
+    async def __aenter__(self) -> ChunkIterator:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        await self.aclose()
@@ -2,33 +2,66 @@ from __future__ import annotations
 
 import asyncio
 from types import TracebackType
-from typing import Any, Dict, List, Mapping, Optional, Type
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from asyncql.backends.models.database import DatabaseBackend
-from asyncql.common import query as querylib
+from asyncql.common import locks, query as querylib, rows as rowslib
+from asyncql.models.admission import AdmissionController
+from asyncql.models.pipeline import Pipeline
 from asyncql.models.transaction import Transaction
 
+T = TypeVar("T")
+
 
 class Connection:
-    def __init__(self, backend: DatabaseBackend) -> None:
+    def __init__(
+        self,
+        backend: DatabaseBackend,
+        admission: Optional[AdmissionController] = None,
+        priority: Optional[str] = None,
+        prepare: Optional[Callable[[], Awaitable[None]]] = None,
+    ) -> None:
         self._backend = backend
+        self._prepare = prepare
 
-        self._connection_lock = asyncio.Lock()
+        self._admission = admission
+        self.priority = priority
+        self._admitted_priority: Optional[str] = None
+
+        self._connection_lock = locks.Lock()
         self._connection = self._backend.connection()
         self._connection_counter = 0
 
         self._transaction_lock = asyncio.Lock()
         self._transaction_stack: list[Transaction] = []
 
-        self._query_lock = asyncio.Lock()
+        self._query_lock = locks.Lock()
 
     async def __aenter__(self) -> Connection:
+        # the lock only guards acquiring and releasing, so re-entering an
+        # acquired connection just counts while nobody else is doing either
+        if self._connection_counter and not self._connection_lock.locked():
+            self._connection_counter += 1
+            return self
+
         async with self._connection_lock:
             self._connection_counter += 1
 
             try:
                 if self._connection_counter == 1:
-                    await self._connection.acquire()
+                    await self._acquire()
             except BaseException as exc:
                 self._connection_counter -= 1
                 raise exc
@@ -41,24 +74,79 @@ class Connection:
         exc_value: Optional[BaseException] = None,
         traceback: Optional[TracebackType] = None,
     ) -> None:
-        async with self._connection_lock:
-            if self._connection is None:
-                raise RuntimeError("Connection already closed")
+        if self._connection is None:
+            raise RuntimeError("Connection already closed")
 
+        if self._connection_counter > 1 and not self._connection_lock.locked():
+            self._connection_counter -= 1
+            return
+
+        async with self._connection_lock:
             self._connection_counter -= 1
             if self._connection_counter == 0:
-                await self._connection.release()
+                await self._release()
+
+    async def _acquire(self) -> None:
+        if self._prepare is not None:
+            await self._prepare()
+
+        if self._admission is not None:
+            self._admitted_priority = await self._admission.acquire(self.priority)
 
+        try:
+            await self._connection.acquire()
+        except BaseException as exc:
+            self._release_admission()
+            raise exc
+
+    async def _release(self) -> None:
+        try:
+            await self._connection.release()
+        finally:
+            self._release_admission()
+
+    def _release_admission(self) -> None:
+        if self._admission is not None and self._admitted_priority is not None:
+            self._admission.release(self._admitted_priority)
+            self._admitted_priority = None
+
+    @overload
     async def fetch_all(
         self,
         query: str,
         params: Optional[Mapping[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
+        ...
+
+    @overload
+    async def fetch_all(
+        self,
+        query: str,
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        as_: Type[T],
+    ) -> List[T]:
+        ...
+
+    async def fetch_all(
+        self,
+        query: str,
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        as_: Optional[Type[T]] = None,
+    ) -> Union[List[Dict[str, Any]], List[T]]:
         if params is not None:
             query = querylib.parse_query(query, params)
 
-        async with self._query_lock:
-            rows = await self._connection.fetch_all(query)
+        if as_ is not None:
+            columns, tuples = await self._query_lock.run(
+                self._connection.fetch_all_tuples,
+                query,
+            )
+
+            return rowslib.map_rows(columns, tuples, as_)
+
+        rows = await self._query_lock.run(self._connection.fetch_all, query)
 
         return rows
 
@@ -70,8 +158,7 @@ class Connection:
         if params is not None:
             query = querylib.parse_query(query, params)
 
-        async with self._query_lock:
-            row = await self._connection.fetch_one(query)
+        row = await self._query_lock.run(self._connection.fetch_one, query)
 
         return row
 
@@ -83,8 +170,7 @@ class Connection:
         if params is not None:
             query = querylib.parse_query(query, params)
 
-        async with self._query_lock:
-            result = await self._connection.execute(query)
+        result = await self._query_lock.run(self._connection.execute, query)
 
         return result
 
@@ -97,8 +183,7 @@ class Connection:
         if params is not None:
             queries = [querylib.parse_query(query, param) for param in params]
 
-        async with self._query_lock:
-            await self._connection.execute_many(queries)
+        await self._query_lock.run(self._connection.execute_many, queries)
 
     async def transaction(
         self,
@@ -111,6 +196,12 @@ class Connection:
 
         return Transaction(connection_callable, force_rollback, **kwargs)
 
+    def pipeline(self) -> Pipeline:
+        def connection_callable() -> Connection:
+            return self
+
+        return Pipeline(connection_callable)
+
     @property
     def raw_connection(self) -> Any:
         return self._connection.raw_connection
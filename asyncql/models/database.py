@@ -1,33 +1,277 @@
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import functools
+import logging
+import threading
 from contextvars import ContextVar
 from types import TracebackType
-from typing import Any, Dict, Iterator, List, Mapping, Optional, Type, Union
-
+from typing import (
+    Any,
+    AsyncGenerator,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from asyncql.backends.models.connection import BackendConnection
 from asyncql.backends.models.database import DatabaseBackend
-from asyncql.common import imports
+from asyncql.common import imports, query as querylib, rows as rowslib
+from asyncql.models.admission import AdmissionController, PriorityStats
+from asyncql.models.chunks import ChunkIterator
 from asyncql.models.connection import Connection
+from asyncql.models.pipeline import Pipeline
 from asyncql.models.transaction import Transaction
 from asyncql.models.url import DatabaseURL
 
+T = TypeVar("T")
+
+MAX_FREE_CONNECTIONS = 64
+
+logger = logging.getLogger(__name__)
+
+
+class _LoopState:
+    def __init__(
+        self,
+        database: Database,
+        loop: asyncio.AbstractEventLoop,
+        backend: DatabaseBackend,
+        admission: Optional[AdmissionController],
+    ) -> None:
+        self.database = database
+        self.loop = loop
+        self.backend = backend
+        self.admission = admission
+
+        self.is_connected = False
+        self.connect_lock = asyncio.Lock()
+
+        self.connection_context: ContextVar[Connection] = ContextVar(
+            "connection_context"
+        )
+        self.global_connection: Optional[Connection] = None
+        self.global_transaction: Optional[Transaction] = None
+
+        self.free_connections: List[BackendConnection] = []
+        self.shutdown_hook: Optional[AsyncGenerator[None, None]] = None
+
+    def active_connection(self) -> Optional[Connection]:
+        if self.global_connection is not None:
+            return self.global_connection
+
+        connection = self.connection_context.get(None)
+        if connection is not None and connection._connection_counter:
+            return connection
+
+        return None
+
+    async def run(
+        self,
+        method: str,
+        query: Any,
+        priority: Optional[str] = None,
+    ) -> Any:
+        # one-off queries from a task that holds no connection run straight on
+        # a backend connection that nothing else can see, so none of the
+        # Connection locks are needed; backend connection objects are reused
+        if not self.is_connected:
+            await self.prepare()
+
+        admission = self.admission
+        admitted: Optional[str] = None
+        if admission is not None:
+            admitted = await admission.acquire(priority)
+
+        try:
+            if self.free_connections:
+                connection = self.free_connections.pop()
+            else:
+                connection = self.backend.connection()
+
+            await connection.acquire()
+            try:
+                result = await getattr(connection, method)(query)
+            finally:
+                await connection.release()
+
+            if len(self.free_connections) < MAX_FREE_CONNECTIONS:
+                self.free_connections.append(connection)
+        finally:
+            if admission is not None and admitted is not None:
+                admission.release(admitted)
+
+        return result
+
+    def new_connection(self, priority: Optional[str] = None) -> Connection:
+        return Connection(self.backend, self.admission, priority, self.prepare)
+
+    async def prepare(self) -> None:
+        # pools on loops other than the one that called connect() are opened
+        # the first time a connection is needed there
+        if self.is_connected or not self.database.is_connected:
+            return
+
+        async with self.connect_lock:
+            if not self.is_connected:
+                await self.connect()
+
+    async def connect(self) -> None:
+        await self.backend.connect()
+        self.is_connected = True
+
+        # the loop closes every live async generator while it shuts down, so
+        # one is kept suspended here to close the pool from its own loop
+        # before asyncio.run() (or a worker thread doing the same) tears it down
+        self.shutdown_hook = self._close_on_shutdown()
+        await self.shutdown_hook.__anext__()
+
+        if self.database._force_rollback:
+            if self.global_connection is not None:
+                raise RuntimeError("Connection already established")
+
+            if self.global_transaction is not None:
+                raise RuntimeError("Transaction already established")
+
+            self.global_connection = self.new_connection()
+            self.global_transaction = await self.global_connection.transaction(
+                force_rollback=True
+            )
+
+            await self.global_transaction.__aenter__()
+
+    async def _close_on_shutdown(self) -> AsyncGenerator[None, None]:
+        try:
+            yield
+        finally:
+            if self.is_connected:
+                # the generator is running, so disconnect() mustn't close it
+                self.shutdown_hook = None
+                self.database._forget_state(self)
+                await self.disconnect()
+
+    async def disconnect(self) -> None:
+        if not self.is_connected:
+            return
+
+        # marked first, so the shutdown hook (closed here, or finalized by the
+        # loop meanwhile) finds nothing left to disconnect
+        self.is_connected = False
+
+        hook, self.shutdown_hook = self.shutdown_hook, None
+        if hook is not None:
+            await hook.aclose()
+
+        if self.global_transaction is not None:
+            await self.global_transaction.__aexit__()
+
+            self.global_connection = None
+            self.global_transaction = None
+        else:
+            self.connection_context = ContextVar("connection_context")
+
+        self.free_connections.clear()
+
+        await self.backend.disconnect()
+
+
+class _DeferredConnection(Connection):
+    # made outside a running loop, so which loop's pool it uses is only known
+    # once it is first entered (or starts a transaction)
+    def __init__(self, database: Database, priority: Optional[str]) -> None:
+        self._database = database
+        self._bound = False
+        self.priority = priority
+
+    def _bind(self) -> None:
+        if self._bound:
+            return
+
+        state = self._database._state()
+        super().__init__(state.backend, state.admission, self.priority, state.prepare)
+        self._bound = True
+
+        if state.connection_context.get(None) is None:
+            state.connection_context.set(self)
+
+    async def __aenter__(self) -> Connection:
+        self._bind()
+        return await super().__aenter__()
+
+    async def transaction(
+        self,
+        *,
+        force_rollback: bool = False,
+        **kwargs: Any,
+    ) -> Transaction:
+        self._bind()
+        return await super().transaction(force_rollback=force_rollback, **kwargs)
+
 
 class Database:
-    BACKENDS = {"mysql": "asyncql.backends.mysql:MySQLBackend"}
+    BACKENDS = {
+        "mysql": "asyncql.backends.mysql:MySQLBackend",
+        "mysql+aiomysql": "asyncql.backends.mysql:MySQLBackend",
+        "mysql+asyncmy": "asyncql.backends.asyncmy:AsyncmyBackend",
+    }
+
+    # backend options that make up the connection budget shared across loops
+    BUDGET_OPTIONS = ("min_size", "max_size", "warm_up")
 
     def __init__(
         self,
         url: Union[str, DatabaseURL],
         *,
         force_rollback: bool = False,
+        admission: Optional[AdmissionController] = None,
+        loops: Optional[int] = None,
         **kwargs: Any,
     ) -> None:
         if isinstance(url, str):
             url = DatabaseURL(url)
 
+        if loops is not None and loops < 1:
+            raise ValueError("Loops must be at least 1")
+
+        if admission is not None:
+            # admitted work beyond the pool size would only queue again inside
+            # the pool, where priorities and reservations no longer apply
+            max_size = kwargs.get("max_size")
+            if max_size is None:
+                kwargs["max_size"] = max(
+                    admission.capacity,
+                    kwargs.get("min_size") or 0,
+                )
+            elif admission.capacity > max_size:
+                raise ValueError(
+                    f"Admission capacity {admission.capacity} exceeds the pool "
+                    f"max_size {max_size}"
+                )
+
+            # each loop gets an even share of the capacity but every class
+            # keeps its whole reservation, so the share must still fit them
+            if loops is not None and loops > 1:
+                try:
+                    admission.copy(max(1, admission.capacity // loops))
+                except ValueError as exc:
+                    raise ValueError(
+                        f"Admission capacity {admission.capacity} split between "
+                        f"{loops} loops: {exc}"
+                    ) from None
+
         self._url = url
         self._kwargs = kwargs
         self._force_rollback = force_rollback
+        self._admission = admission
+        self._loops = loops
 
         self.is_connected = False
 
@@ -36,56 +280,133 @@ class Database:
         if not issubclass(backend, DatabaseBackend):
             raise TypeError(f"Backend must be a subclass of DatabaseBackend")
 
-        self._backend = backend(self._url, **self._kwargs)
+        self._backend_class = backend
 
-        self._connection_context: ContextVar[Connection] = ContextVar(
-            "connection_context"
-        )
-        self._global_connection: Optional[Connection] = None
-        self._global_transaction: Optional[Transaction] = None
+        self._states: Dict[asyncio.AbstractEventLoop, _LoopState] = {}
+        self._states_lock = threading.Lock()
 
-    async def connect(self) -> None:
-        if self.is_connected:
-            return
+    def _create_state(self, loop: asyncio.AbstractEventLoop) -> _LoopState:
+        kwargs = dict(self._kwargs)
+        admission = self._admission
 
-        await self._backend.connect()
-        self.is_connected = True
+        # the configured sizes are a total budget, split evenly between the
+        # loops; admission state is bound to a loop, so each gets its own
+        if self._loops is not None and self._loops > 1:
+            for option in self.BUDGET_OPTIONS:
+                if kwargs.get(option):
+                    kwargs[option] = max(1, kwargs[option] // self._loops)
 
-        if self._force_rollback:
-            if self._global_connection is not None:
-                raise RuntimeError("Connection already established")
+            if admission is not None:
+                admission = admission.copy(max(1, admission.capacity // self._loops))
 
-            if self._global_transaction is not None:
-                raise RuntimeError("Transaction already established")
+        backend = self._backend_class(self._url, **kwargs)
+        return _LoopState(self, loop, backend, admission)
 
-            self._global_connection = Connection(self._backend)
-            self._global_transaction = await self._global_connection.transaction(
-                force_rollback=True
-            )
+    def _state(self) -> _LoopState:
+        loop = asyncio.get_running_loop()
 
-            await self._global_transaction.__aenter__()
+        state = self._states.get(loop)
+        if state is not None:
+            return state
 
-    async def disconnect(self) -> None:
-        if not self.is_connected:
-            return
+        with self._states_lock:
+            state = self._states.get(loop)
+            if state is not None:
+                return state
 
-        if self._force_rollback:
-            if self._global_connection is None:
-                raise RuntimeError("Connection not established")
+            for other_loop, other_state in list(self._states.items()):
+                if not other_loop.is_closed():
+                    continue
 
-            if self._global_transaction is None:
-                raise RuntimeError("Transaction not established")
+                del self._states[other_loop]
+                if other_state.is_connected:
+                    logger.warning(
+                        "Event loop closed without closing its database pool, "
+                        "its connections were leaked"
+                    )
 
-            await self._global_transaction.__aexit__()
+            # without an explicit number of loops there is nothing to split the
+            # connection budget by, so only one loop may use it at a time
+            loops = self._loops or 1
+            if len(self._states) >= loops:
+                raise RuntimeError(
+                    f"Database is already in use from {loops} event loop(s), "
+                    "pass loops= to share it between more"
+                )
 
-            self._global_connection = None
-            self._global_transaction = None
-        else:
-            self._connection_context = ContextVar("connection_context")
+            state = self._states[loop] = self._create_state(loop)
+
+        return state
+
+    def _forget_state(self, state: _LoopState) -> None:
+        with self._states_lock:
+            if self._states.get(state.loop) is state:
+                del self._states[state.loop]
+
+    async def connect(self) -> None:
+        state = self._state()
+        if state.is_connected:
+            return
+
+        async with state.connect_lock:
+            if not state.is_connected:
+                await state.connect()
+
+        self.is_connected = True
+
+    async def disconnect(self) -> None:
+        if not self.is_connected:
+            return
 
-        await self._backend.disconnect()
         self.is_connected = False
 
+        current_loop = asyncio.get_running_loop()
+        with self._states_lock:
+            states = list(self._states.values())
+            self._states.clear()
+
+        for state in states:
+            if state.loop is current_loop:
+                await state.disconnect()
+            elif state.loop.is_running():
+                # pools can only be closed from the loop they belong to
+                future = asyncio.run_coroutine_threadsafe(
+                    state.disconnect(),
+                    state.loop,
+                )
+                await asyncio.wrap_future(future)
+            elif state.is_connected:
+                logger.warning(
+                    "Database pool of a stopped event loop can't be closed, "
+                    "its connections were leaked"
+                )
+
+    def stats(self) -> Dict[str, Any]:
+        with self._states_lock:
+            states = list(self._states.values())
+
+        pool: Dict[str, int] = {}
+        admission: Dict[str, PriorityStats] = {}
+        for state in states:
+            for name, value in state.backend.stats().items():
+                pool[name] = pool.get(name, 0) + value
+
+            if state.admission is None:
+                continue
+
+            for priority, priority_stats in state.admission.stats().items():
+                total = admission.setdefault(priority, PriorityStats())
+                total.waiting += priority_stats.waiting
+                total.active += priority_stats.active
+                total.admitted += priority_stats.admitted
+                total.total_wait_time += priority_stats.total_wait_time
+                total.max_wait_time = max(
+                    total.max_wait_time,
+                    priority_stats.max_wait_time,
+                )
+
+        return {"loops": len(states), "pool": pool, "admission": admission}
+
     async def __aenter__(self) -> Database:
         await self.connect()
         return self
@@ -98,13 +419,50 @@ class Database:
     ) -> None:
         await self.disconnect()
 
+    @overload
     async def fetch_all(
         self,
         query: str,
         params: Optional[Mapping[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
-        async with self.connection() as connection:
-            rows = await connection.fetch_all(query, params)
+        ...
+
+    @overload
+    async def fetch_all(
+        self,
+        query: str,
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        as_: Type[T],
+    ) -> List[T]:
+        ...
+
+    async def fetch_all(
+        self,
+        query: str,
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        as_: Optional[Type[T]] = None,
+    ) -> Union[List[Dict[str, Any]], List[T]]:
+        if params is not None:
+            query = querylib.parse_query(query, params)
+
+        state = self._state()
+        connection = state.active_connection()
+
+        if as_ is not None:
+            if connection is None:
+                columns, tuples = await state.run("fetch_all_tuples", query)
+                return rowslib.map_rows(columns, tuples, as_)
+
+            async with connection:
+                return await connection.fetch_all(query, as_=as_)
+
+        if connection is None:
+            return await state.run("fetch_all", query)
+
+        async with connection:
+            rows = await connection.fetch_all(query)
 
         return rows
 
@@ -113,8 +471,16 @@ class Database:
         query: str,
         params: Optional[Mapping[str, Any]] = None,
     ) -> Optional[Dict[str, Any]]:
-        async with self.connection() as connection:
-            row = await connection.fetch_one(query, params)
+        if params is not None:
+            query = querylib.parse_query(query, params)
+
+        state = self._state()
+        connection = state.active_connection()
+        if connection is None:
+            return await state.run("fetch_one", query)
+
+        async with connection:
+            row = await connection.fetch_one(query)
 
         return row
 
@@ -123,8 +489,16 @@ class Database:
         query: str,
         params: Optional[Mapping[str, Any]] = None,
     ) -> Any:
-        async with self.connection() as connection:
-            result = await connection.execute(query, params)
+        if params is not None:
+            query = querylib.parse_query(query, params)
+
+        state = self._state()
+        connection = state.active_connection()
+        if connection is None:
+            return await state.run("execute", query)
+
+        async with connection:
+            result = await connection.execute(query)
 
         return result
 
@@ -133,18 +507,74 @@ class Database:
         query: str,
         params: List[Mapping[str, Any]],
     ) -> None:
-        async with self.connection() as connection:
+        state = self._state()
+        connection = state.active_connection()
+        if connection is None:
+            queries = [querylib.parse_query(query, param) for param in params]
+            await state.run("execute_many", queries)
+            return
+
+        async with connection:
             await connection.execute_many(query, params)
 
-    def connection(self) -> Connection:
-        if self._global_connection is not None:
-            return self._global_connection
+    def iterate_chunks(
+        self,
+        table_or_query: str,
+        params: Optional[Mapping[str, Any]] = None,
+        *,
+        key: Union[str, Sequence[str]] = "id",
+        chunk_size: int = 1000,
+        start_after: Optional[Sequence[Any]] = None,
+        priority: Optional[str] = None,
+    ) -> ChunkIterator:
+        return ChunkIterator(
+            functools.partial(self._fetch_chunk, priority=priority),
+            table_or_query,
+            key,
+            chunk_size,
+            params,
+            start_after,
+        )
+
+    async def _fetch_chunk(
+        self,
+        query: str,
+        params: Mapping[str, Any],
+        priority: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        query = querylib.parse_query(query, params)
+
+        # chunks never join the caller's connection, so a scan is not held
+        # inside whatever transaction the caller happens to be in
+        state = self._state()
+        if state.global_connection is None:
+            return await state.run("fetch_all", query, priority)
+
+        async with state.global_connection:
+            rows = await state.global_connection.fetch_all(query)
+
+        return rows
+
+    def connection(self, priority: Optional[str] = None) -> Connection:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return _DeferredConnection(self, priority)
+
+        state = self._state()
+        if state.global_connection is not None:
+            return state.global_connection
 
         try:
-            connection = self._connection_context.get()
+            connection = state.connection_context.get()
         except LookupError:
-            connection = Connection(self._backend)
-            self._connection_context.set(connection)
+            connection = state.new_connection(priority)
+            state.connection_context.set(connection)
+        else:
+            # the priority only matters when the connection is next acquired,
+            # so one that is already in use keeps the class it was admitted as
+            if not connection._connection_counter:
+                connection.priority = priority
 
         return connection
 
@@ -152,14 +582,18 @@ class Database:
         self,
         *,
         force_rollback: bool = False,
+        priority: Optional[str] = None,
         **kwargs: Any,
     ) -> Transaction:
         return Transaction(
-            self.connection,
+            functools.partial(self.connection, priority=priority),
             force_rollback,
             **kwargs,
         )
 
+    def pipeline(self, *, priority: Optional[str] = None) -> Pipeline:
+        return Pipeline(functools.partial(self.connection, priority=priority))
+
     @contextlib.contextmanager
     def force_rollback(self) -> Iterator[None]:
         initial = self._force_rollback
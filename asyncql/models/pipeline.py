@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+from types import TracebackType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from asyncql.common import query as querylib
+from asyncql.exceptions import PipelineError
+
+if TYPE_CHECKING:
+    from asyncql.models.connection import Connection
+
+FETCH_ALL = "fetch_all"
+FETCH_ONE = "fetch_one"
+EXECUTE = "execute"
+
+
+class Pipeline:
+    def __init__(self, connection_callable: Callable[[], Connection]) -> None:
+        self._connection_callable = connection_callable
+        self._connection: Optional[Connection] = None
+        self._queue: List[Tuple[str, str, asyncio.Future[Any]]] = []
+
+    async def __aenter__(self) -> Pipeline:
+        self._connection = self._connection_callable()
+        await self._connection.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]] = None,
+        exc_value: Optional[BaseException] = None,
+        traceback: Optional[TracebackType] = None,
+    ) -> None:
+        if self._connection is None:
+            raise RuntimeError("No connection established")
+
+        try:
+            if exc_type is None:
+                await self.flush()
+            else:
+                self._cancel(self._queue)
+                self._queue = []
+        finally:
+            await self._connection.__aexit__()
+            self._connection = None
+
+    def _enqueue(
+        self,
+        kind: str,
+        query: str,
+        params: Optional[Mapping[str, Any]],
+    ) -> asyncio.Future[Any]:
+        if params is not None:
+            query = querylib.parse_query(query, params)
+
+        # results are matched to queries by counting result sets, so a query
+        # holding several statements would shift every later result
+        if querylib.count_statements(query) != 1:
+            raise ValueError("Pipelined queries must be exactly one statement")
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._queue.append((kind, query, future))
+
+        return future
+
+    def fetch_all(
+        self,
+        query: str,
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> asyncio.Future[List[Dict[str, Any]]]:
+        return self._enqueue(FETCH_ALL, query, params)
+
+    def fetch_one(
+        self,
+        query: str,
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> asyncio.Future[Optional[Dict[str, Any]]]:
+        return self._enqueue(FETCH_ONE, query, params)
+
+    def execute(
+        self,
+        query: str,
+        params: Optional[Mapping[str, Any]] = None,
+    ) -> asyncio.Future[Any]:
+        return self._enqueue(EXECUTE, query, params)
+
+    @staticmethod
+    def _resolve(
+        future: asyncio.Future[Any],
+        kind: str,
+        result: Tuple[List[Dict[str, Any]], Any],
+    ) -> None:
+        rows, last_row_id = result
+
+        if kind == FETCH_ALL:
+            future.set_result(rows)
+        elif kind == FETCH_ONE:
+            future.set_result(rows[0] if rows else None)
+        else:
+            future.set_result(last_row_id)
+
+    @staticmethod
+    def _cancel(queue: List[Tuple[str, str, asyncio.Future[Any]]]) -> None:
+        for _, _, future in queue:
+            future.cancel()
+
+    async def flush(self) -> None:
+        if self._connection is None:
+            raise RuntimeError("No connection established")
+
+        queue, self._queue = self._queue, []
+        if not queue:
+            return
+
+        connection = self._connection
+        try:
+            results = await connection._query_lock.run(
+                connection._connection.execute_pipeline,
+                [query for _, query, _ in queue],
+            )
+        except PipelineError as exc:
+            for (kind, _, future), result in zip(queue, exc.results):
+                self._resolve(future, kind, result)
+
+            failed = queue[exc.index][2]
+            failed.set_exception(exc)
+            # the same error is raised from flush, so it has been seen
+            failed.exception()
+
+            self._cancel(queue[exc.index + 1 :])
+            raise exc
+        except BaseException as exc:
+            self._cancel(queue)
+            raise exc
+
+        for (kind, _, future), result in zip(queue, results):
+            self._resolve(future, kind, result)
@@ -0,0 +1,163 @@
+#!/usr/bin/env python
+
+# per-query overhead of asyncql itself, measured against a backend whose
+# queries return immediately, so everything timed is library code
+#
+#   $ PYTHONPATH=. python benchmarks/query_overhead.py [queries]
+
+import asyncio
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple, TypeVar
+
+from asyncql import Database
+from asyncql.backends.models.connection import BackendConnection
+from asyncql.backends.models.database import DatabaseBackend
+from asyncql.backends.models.transaction import BackendTransaction
+from asyncql.common import locks
+
+T = TypeVar("T")
+
+ROW = {"id": 1}
+
+
+class NoopConnection(BackendConnection):
+    def __init__(self, database: DatabaseBackend) -> None:
+        self._database = database
+
+    async def acquire(self) -> None:
+        pass
+
+    async def release(self) -> None:
+        pass
+
+    async def fetch_all(self, query: str) -> List[Dict[str, Any]]:
+        return [ROW]
+
+    async def fetch_all_tuples(
+        self,
+        query: str,
+    ) -> Tuple[Sequence[str], Sequence[Sequence[Any]]]:
+        return ["id"], [(1,)]
+
+    async def fetch_one(self, query: str) -> Dict[str, Any]:
+        return ROW
+
+    async def execute(self, query: str) -> int:
+        return 1
+
+    async def execute_many(self, queries: List[str]) -> None:
+        pass
+
+    async def execute_pipeline(
+        self,
+        queries: List[str],
+    ) -> List[Tuple[List[Dict[str, Any]], Any]]:
+        return [([ROW], 1) for _ in queries]
+
+    def transaction(self) -> BackendTransaction:
+        raise NotImplementedError()
+
+    @property
+    def raw_connection(self) -> Any:
+        return None
+
+
+class NoopBackend(DatabaseBackend):
+    def __init__(self, database_url: Any, **kwargs: Any) -> None:
+        pass
+
+    async def connect(self) -> None:
+        pass
+
+    async def disconnect(self) -> None:
+        pass
+
+    def connection(self) -> BackendConnection:
+        return NoopConnection(self)
+
+    def stats(self) -> Dict[str, int]:
+        return {}
+
+
+class StockLock(locks.Lock):
+    async def run(self, func: Callable[..., Awaitable[T]], *args: Any) -> T:
+        async with self:
+            return await func(*args)
+
+
+Database.BACKENDS["noop"] = f"{__name__}:NoopBackend"
+
+
+async def timed(queries: int, run: Callable[[], Awaitable[None]]) -> float:
+    best = float("inf")
+    for _ in range(5):
+        started_at = time.perf_counter()
+        await run()
+        best = min(best, time.perf_counter() - started_at)
+
+    return best / queries * 1e6
+
+
+async def main(queries: int) -> None:
+    database = Database("noop://localhost/benchmark")
+    await database.connect()
+
+    async def backend_only() -> None:
+        connection = NoopConnection(database._state().backend)
+        for _ in range(queries):
+            await connection.acquire()
+            await connection.fetch_one("SELECT 1")
+            await connection.release()
+
+    async def one_shot() -> None:
+        for _ in range(queries):
+            await database.fetch_one("SELECT 1")
+
+    async def one_shot_params() -> None:
+        for index in range(queries):
+            await database.fetch_one("SELECT :id", {"id": index})
+
+    async def in_connection() -> None:
+        async with database.connection():
+            for _ in range(queries):
+                await database.fetch_one("SELECT 1")
+
+    async def in_connection_asyncio_lock() -> None:
+        # the same path with a full asyncio.Lock round trip around every query,
+        # as queries used to take
+        async with database.connection() as connection:
+            lock = connection._query_lock
+            connection._query_lock = StockLock()
+            try:
+                for _ in range(queries):
+                    await database.fetch_one("SELECT 1")
+            finally:
+                connection._query_lock = lock
+
+    async def shared_connection() -> None:
+        async with database.connection() as connection:
+
+            async def worker() -> None:
+                for _ in range(queries // 10):
+                    await connection.fetch_one("SELECT 1")
+
+            await asyncio.gather(*(worker() for _ in range(10)))
+
+    for name, run in (
+        ("backend only (floor)", backend_only),
+        ("Database.fetch_one", one_shot),
+        ("Database.fetch_one with params", one_shot_params),
+        ("inside database.connection()", in_connection),
+        ("inside database.connection(), asyncio.Lock", in_connection_asyncio_lock),
+        ("shared connection, 10 tasks", shared_connection),
+    ):
+        # each run gets a fresh task, as a request handler would
+        overhead = await timed(queries, lambda: asyncio.ensure_future(run()))
+        print(f"{name:<45} {overhead:6.2f} us/query")
+
+    await database.disconnect()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000))
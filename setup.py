@@ -44,6 +44,7 @@ setup(
     extras_require={
         "postgresql": ["asyncpg"],
         "mysql": ["aiomysql"],
+        "asyncmy": ["asyncmy"],
         "sqlite": ["aiosqlite"],
     },
     classifiers=[
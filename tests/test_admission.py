@@ -0,0 +1,193 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from asyncql.models.admission import AdmissionController, PriorityClass
+
+
+async def settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def admission_order(
+    controller: AdmissionController,
+    held: List[str],
+    queued: List[str],
+) -> List[str]:
+    # every slot starts held by `held`; slots are then freed one at a time so
+    # each release admits exactly one queued waiter
+    order: List[str] = []
+
+    async def wait(priority: str) -> None:
+        await controller.acquire(priority)
+        order.append(priority)
+
+    for priority in held:
+        await controller.acquire(priority)
+
+    tasks = [asyncio.ensure_future(wait(priority)) for priority in queued]
+    await settle()
+
+    active = list(held)
+    for _ in queued:
+        controller.release(active.pop(0))
+        await settle()
+        active.append(order[-1])
+
+    await asyncio.gather(*tasks)
+    return order
+
+
+def test_weights_under_contention() -> None:
+    async def main() -> None:
+        controller = AdmissionController(
+            1,
+            {"hi": PriorityClass(weight=3), "lo": PriorityClass(weight=1)},
+        )
+        order = await admission_order(controller, ["lo"], ["lo"] * 8 + ["hi"] * 8)
+
+        assert order[:8].count("hi") == 6
+        assert order[:8].count("lo") == 2
+
+    asyncio.run(main())
+
+
+def test_uncontended_admissions_build_no_debt() -> None:
+    async def main() -> None:
+        controller = AdmissionController(
+            2,
+            {"hi": PriorityClass(weight=4), "lo": PriorityClass(weight=1)},
+        )
+        for _ in range(200):
+            await controller.acquire("hi")
+            controller.release("hi")
+
+        order = await admission_order(
+            controller,
+            ["lo", "lo"],
+            ["lo"] * 40 + ["hi"] * 5,
+        )
+
+        assert "hi" not in order[6:]
+
+    asyncio.run(main())
+
+
+def test_idle_class_rejoins_without_credit() -> None:
+    async def main() -> None:
+        controller = AdmissionController(
+            1,
+            {"a": PriorityClass(), "b": PriorityClass()},
+        )
+        # a is served alone under contention for a while, b sits idle
+        await admission_order(controller, ["a"], ["a"] * 20)
+        controller.release("a")
+
+        order = await admission_order(controller, ["a"], ["a"] * 10 + ["b"] * 10)
+        assert order[:10].count("b") <= 6
+
+    asyncio.run(main())
+
+
+def test_limit() -> None:
+    async def main() -> None:
+        controller = AdmissionController(
+            3,
+            {"batch": PriorityClass(limit=1), "web": PriorityClass()},
+        )
+        await controller.acquire("batch")
+
+        waiter = asyncio.ensure_future(controller.acquire("batch"))
+        await settle()
+        assert not waiter.done()
+
+        # the queued batch waiter doesn't hold up a class that can be admitted
+        assert await controller.acquire("web") == "web"
+        assert controller.stats()["batch"].waiting == 1
+
+        controller.release("batch")
+        assert await waiter == "batch"
+
+    asyncio.run(main())
+
+
+def test_reservation() -> None:
+    async def main() -> None:
+        controller = AdmissionController(
+            2,
+            {"web": PriorityClass(reserved=1), "batch": PriorityClass()},
+        )
+        await controller.acquire("batch")
+
+        # the last free slot is web's reservation
+        waiter = asyncio.ensure_future(controller.acquire("batch"))
+        await settle()
+        assert not waiter.done()
+
+        assert await controller.acquire("web") == "web"
+
+        controller.release("batch")
+        assert await waiter == "batch"
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_is_dropped() -> None:
+    async def main() -> None:
+        controller = AdmissionController(1, {"default": PriorityClass()})
+        await controller.acquire()
+
+        cancelled = asyncio.ensure_future(controller.acquire())
+        waiter = asyncio.ensure_future(controller.acquire())
+        await settle()
+
+        cancelled.cancel()
+        await settle()
+        assert controller.stats()["default"].waiting == 1
+
+        controller.release()
+        assert await waiter == "default"
+        assert controller.stats()["default"].active == 1
+
+    asyncio.run(main())
+
+
+def test_cancelled_after_admission_releases() -> None:
+    async def main() -> None:
+        controller = AdmissionController(1, {"default": PriorityClass()})
+        await controller.acquire()
+
+        waiter = asyncio.ensure_future(controller.acquire())
+        await settle()
+
+        # the slot is handed over, but the task is cancelled before it resumes
+        controller.release()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert controller.stats()["default"].active == 0
+        assert await controller.acquire() == "default"
+
+    asyncio.run(main())
+
+
+def test_invalid_configuration() -> None:
+    with pytest.raises(ValueError):
+        PriorityClass(weight=0)
+    with pytest.raises(ValueError):
+        PriorityClass(limit=1, reserved=2)
+    with pytest.raises(ValueError):
+        AdmissionController(
+            1, {"a": PriorityClass(reserved=1), "b": PriorityClass(reserved=1)}
+        )
+    with pytest.raises(ValueError):
+        AdmissionController(1, {"a": PriorityClass()}, default="b")
+
+    controller = AdmissionController(1, {"a": PriorityClass()})
+    with pytest.raises(ValueError):
+        asyncio.run(controller.acquire("b"))
+    with pytest.raises(RuntimeError):
+        controller.release("a")
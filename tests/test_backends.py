@@ -0,0 +1,348 @@
+import asyncio
+import dataclasses
+import datetime
+import decimal
+import json
+import os
+from typing import Any, Awaitable, Callable, List
+
+import pytest
+
+from asyncql import Database
+from asyncql.backends.decoding import DATETIME, LazyValue, ResultDecoder
+from asyncql.backends.mysql_base import BaseMySQLBackend, MySQLConnection
+from asyncql.exceptions import PipelineError
+from asyncql.models.url import DatabaseURL
+
+# every case runs once per mysql backend against the same server, e.g.
+#
+#   $ docker run --rm -d -p 3306:3306 -e MYSQL_ALLOW_EMPTY_PASSWORD=1 \
+#       -e MYSQL_DATABASE=asyncql_test mysql:8
+#   $ ASYNCQL_TEST_MYSQL_URL=mysql://root@127.0.0.1:3306/asyncql_test \
+#       python -m pytest tests/test_backends.py
+DATABASE_URL = os.environ.get("ASYNCQL_TEST_MYSQL_URL")
+
+BACKENDS = [
+    pytest.param(("mysql", "aiomysql"), id="aiomysql"),
+    pytest.param(("mysql+asyncmy", "asyncmy"), id="asyncmy"),
+]
+
+CREATE_TABLE = """
+CREATE TABLE asyncql_test (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(64) NOT NULL,
+    price DECIMAL(10, 2) NULL,
+    payload JSON NULL,
+    created_at DATETIME NULL
+)
+"""
+
+INSERT = """
+INSERT INTO asyncql_test (name, price, payload, created_at)
+VALUES (:name, :price, :payload, :created_at)
+"""
+
+CREATED_AT = datetime.datetime(2024, 1, 2, 3, 4, 5)
+
+
+@dataclasses.dataclass
+class Item:
+    id: int
+    name: str
+
+
+@pytest.fixture(params=BACKENDS)
+def url(request: Any) -> str:
+    scheme, driver = request.param
+    if DATABASE_URL is None:
+        pytest.skip("ASYNCQL_TEST_MYSQL_URL is not set")
+
+    pytest.importorskip(driver)
+    return str(DatabaseURL(DATABASE_URL).replace(scheme=scheme))
+
+
+def run(
+    url: str,
+    test: Callable[[Database], Awaitable[None]],
+    **kwargs: Any,
+) -> None:
+    async def main() -> None:
+        async with Database(url, **kwargs) as database:
+            await database.execute("DROP TABLE IF EXISTS asyncql_test")
+            await database.execute(CREATE_TABLE)
+
+            try:
+                await test(database)
+            finally:
+                await database.execute("DROP TABLE asyncql_test")
+
+    asyncio.run(main())
+
+
+async def insert(database: Database, name: str) -> int:
+    return await database.execute(
+        INSERT,
+        {
+            "name": name,
+            "price": decimal.Decimal("1.50"),
+            "payload": json.dumps({"name": name}),
+            "created_at": CREATED_AT,
+        },
+    )
+
+
+def test_execute_and_fetch(url: str) -> None:
+    async def test(database: Database) -> None:
+        first = await insert(database, "it's")
+        second = await insert(database, "second")
+        assert second == first + 1
+
+        row = await database.fetch_one(
+            "SELECT id, name, price, created_at FROM asyncql_test WHERE id = :id",
+            {"id": first},
+        )
+        assert row == {
+            "id": first,
+            "name": "it's",
+            "price": decimal.Decimal("1.50"),
+            "created_at": CREATED_AT,
+        }
+
+        rows = await database.fetch_all("SELECT name FROM asyncql_test ORDER BY id")
+        assert rows == [{"name": "it's"}, {"name": "second"}]
+
+        assert (
+            await database.fetch_one("SELECT * FROM asyncql_test WHERE id = 0") is None
+        )
+
+    run(url, test)
+
+
+def test_execute_many(url: str) -> None:
+    async def test(database: Database) -> None:
+        await database.execute_many(
+            "INSERT INTO asyncql_test (name) VALUES (:name)",
+            [{"name": "a"}, {"name": "b"}, {"name": "c"}],
+        )
+
+        rows = await database.fetch_all("SELECT name FROM asyncql_test ORDER BY id")
+        assert [row["name"] for row in rows] == ["a", "b", "c"]
+
+    run(url, test)
+
+
+def test_fetch_all_as_type(url: str) -> None:
+    async def test(database: Database) -> None:
+        first = await insert(database, "typed")
+
+        items = await database.fetch_all(
+            "SELECT id, name FROM asyncql_test",
+            as_=Item,
+        )
+        assert items == [Item(id=first, name="typed")]
+
+    run(url, test)
+
+
+def test_transactions(url: str) -> None:
+    async def test(database: Database) -> None:
+        async with database.transaction():
+            await insert(database, "committed")
+
+        try:
+            async with database.transaction():
+                await insert(database, "rolled back")
+                raise RuntimeError()
+        except RuntimeError:
+            pass
+
+        async with database.transaction():
+            await insert(database, "outer")
+
+            try:
+                async with database.transaction():
+                    await insert(database, "savepoint")
+                    raise RuntimeError()
+            except RuntimeError:
+                pass
+
+        rows = await database.fetch_all("SELECT name FROM asyncql_test ORDER BY id")
+        assert [row["name"] for row in rows] == ["committed", "outer"]
+
+    run(url, test)
+
+
+def test_pipeline(url: str) -> None:
+    async def test(database: Database) -> None:
+        async with database.pipeline() as pipeline:
+            inserted = pipeline.execute(
+                "INSERT INTO asyncql_test (name) VALUES (:name)",
+                {"name": "a;b"},
+            )
+            rows = pipeline.fetch_all("SELECT id, name FROM asyncql_test")
+            missing = pipeline.fetch_one("SELECT id FROM asyncql_test WHERE id = 0")
+
+        assert rows.result() == [{"id": inserted.result(), "name": "a;b"}]
+        assert missing.result() is None
+
+    run(url, test)
+
+
+def test_pipeline_error(url: str) -> None:
+    async def test(database: Database) -> None:
+        with pytest.raises(PipelineError) as info:
+            async with database.pipeline() as pipeline:
+                first = pipeline.fetch_one("SELECT 1 AS value")
+                pipeline.execute("SELECT * FROM asyncql_missing_table")
+                after = pipeline.fetch_one("SELECT 2 AS value")
+
+        assert info.value.index == 1
+        assert first.result() == {"value": 1}
+        assert after.cancelled()
+
+        # no result set of the failed batch is left behind on the connection
+        assert await database.fetch_one("SELECT 3 AS value") == {"value": 3}
+
+    run(url, test)
+
+
+def test_pipeline_rejects_multiple_statements(url: str) -> None:
+    async def test(database: Database) -> None:
+        async with database.pipeline() as pipeline:
+            with pytest.raises(ValueError):
+                pipeline.fetch_all("SELECT 1; SELECT 2")
+
+    run(url, test)
+
+
+class RecordingCursor:
+    description = None
+    lastrowid = 0
+
+    def __init__(self, statements: List[str]) -> None:
+        self._statements = statements
+
+    async def __aenter__(self) -> "RecordingCursor":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def execute(self, statement: str) -> None:
+        self._statements.append(statement)
+
+    async def fetchall(self) -> List[Any]:
+        return []
+
+    async def nextset(self) -> bool:
+        return True
+
+
+class RecordingConnection:
+    def __init__(self) -> None:
+        self.statements: List[str] = []
+
+    def cursor(self, cursor_class: Any = None) -> RecordingCursor:
+        return RecordingCursor(self.statements)
+
+
+def test_pipeline_statement_separators() -> None:
+    raw_connection = RecordingConnection()
+    connection = MySQLConnection(BaseMySQLBackend("mysql://localhost/test"))
+    connection._connection = raw_connection
+
+    queries = ["SELECT 1 -- first", "SELECT 2; # second", "SELECT ';';"]
+    results = asyncio.run(connection.execute_pipeline(queries))
+
+    assert len(results) == 3
+    assert raw_connection.statements == [
+        "SELECT 1 -- first\n;\nSELECT 2 # second\n;\nSELECT ';'",
+    ]
+
+
+def test_decoder(url: str) -> None:
+    decoder = ResultDecoder(
+        decimal_as_float=True,
+        bytes_types=[DATETIME],
+        columns={"payload": json.loads},
+        lazy_columns=["payload"],
+    )
+
+    async def test(database: Database) -> None:
+        await insert(database, "decoded")
+
+        row = await database.fetch_one(
+            "SELECT price, payload, created_at FROM asyncql_test",
+        )
+        assert row is not None
+        assert row["price"] == 1.5 and isinstance(row["price"], float)
+        assert row["created_at"] == b"2024-01-02 03:04:05"
+
+        payload = row["payload"]
+        assert isinstance(payload, LazyValue)
+        assert payload.get() == {"name": "decoded"}
+
+    run(url, test, decoder=decoder)
+
+
+def test_decoder_repeated_column_names(url: str) -> None:
+    decoder = ResultDecoder(columns={"payload": json.loads})
+
+    async def test(database: Database) -> None:
+        await insert(database, "joined")
+
+        row = await database.fetch_one(
+            "SELECT a.payload, b.payload FROM asyncql_test a "
+            "JOIN asyncql_test b ON a.id = b.id",
+        )
+        assert row is not None
+        assert list(row.values()) == [{"name": "joined"}, {"name": "joined"}]
+
+    run(url, test, decoder=decoder)
+
+
+def test_decoder_keeps_parameter_encoding(url: str) -> None:
+    decoder = ResultDecoder(decimal_as_float=True)
+
+    async def test(database: Database) -> None:
+        async with database.connection() as connection:
+            async with connection.raw_connection.cursor() as cursor:
+                await cursor.execute("SELECT %s, %s", ("it's", 1))
+                assert tuple(await cursor.fetchone()) == ("it's", 1)
+
+    run(url, test, decoder=decoder)
+
+
+def test_health_check_recycles_dead_connections(url: str) -> None:
+    async def test(database: Database) -> None:
+        victim = await database.fetch_one("SELECT CONNECTION_ID() AS id")
+        assert victim is not None
+
+        async with Database(url) as killer:
+            await killer.execute(f"KILL {victim['id']}")
+
+        maintainer = database._state().backend._maintainer  # type: ignore
+        await maintainer.check()
+
+        assert await database.fetch_one("SELECT 1 AS value") == {"value": 1}
+
+        stats = database.stats()["pool"]
+        assert 1 <= stats["size"] <= stats["max_size"]
+
+    run(
+        url,
+        test,
+        min_size=1,
+        max_size=2,
+        warm_up=1,
+        health_check_interval=3600.0,
+        health_check_idle=0.0,
+    )
+
+
+def test_idle_recycling_is_off_by_default(url: str) -> None:
+    async def test(database: Database) -> None:
+        backend = database._state().backend
+        assert backend._connection_options["pool_recycle"] == -1  # type: ignore
+
+    run(url, test)
@@ -0,0 +1,179 @@
+import asyncio
+import gc
+from typing import Any, Dict, List, Mapping, Tuple
+
+import pytest
+
+from asyncql.models.chunks import ChunkIterator
+
+ROWS = [{"id": index, "name": str(index)} for index in range(1, 6)]
+
+
+class Fetcher:
+    def __init__(self, rows: List[Dict[str, Any]], key: str = "id") -> None:
+        self.rows = rows
+        self.key = key
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+
+    async def __call__(
+        self,
+        query: str,
+        params: Mapping[str, Any],
+    ) -> List[Dict[str, Any]]:
+        self.calls.append((query, dict(params)))
+        after = params.get("asyncql_after_0")
+        rows = [row for row in self.rows if after is None or row[self.key] > after]
+        return rows[: int(query.rsplit("LIMIT", 1)[1])]
+
+
+async def collect(chunks: ChunkIterator) -> List[List[Any]]:
+    return [[row["id"] for row in chunk] async for chunk in chunks]
+
+
+def test_table_queries() -> None:
+    fetcher = Fetcher(ROWS)
+    chunks = ChunkIterator(fetcher, "items", "id", 2, params={"extra": 1})
+
+    assert asyncio.run(collect(chunks)) == [[1, 2], [3, 4], [5]]
+    assert [query for query, _ in fetcher.calls] == [
+        "SELECT * FROM items ORDER BY id LIMIT 2",
+        "SELECT * FROM items WHERE id > :asyncql_after_0 ORDER BY id LIMIT 2",
+        "SELECT * FROM items WHERE id > :asyncql_after_0 ORDER BY id LIMIT 2",
+    ]
+    assert [params for _, params in fetcher.calls] == [
+        {"extra": 1},
+        {"extra": 1, "asyncql_after_0": 2},
+        {"extra": 1, "asyncql_after_0": 4},
+    ]
+    assert (chunks.chunks, chunks.rows, chunks.last_key) == (3, 5, (5,))
+
+
+def test_full_last_chunk_needs_one_more_fetch() -> None:
+    fetcher = Fetcher(ROWS[:4])
+    chunks = ChunkIterator(fetcher, "items", "id", 2)
+
+    assert asyncio.run(collect(chunks)) == [[1, 2], [3, 4]]
+    assert len(fetcher.calls) == 3
+    assert (chunks.chunks, chunks.rows) == (2, 4)
+
+
+def test_derived_table_with_qualified_key() -> None:
+    fetcher = Fetcher(ROWS)
+    chunks = ChunkIterator(
+        fetcher,
+        "SELECT i.id, i.name FROM items i WHERE i.name != :name",
+        "i.id",
+        10,
+        params={"name": ""},
+    )
+
+    assert asyncio.run(collect(chunks)) == [[1, 2, 3, 4, 5]]
+    assert fetcher.calls[0][0] == (
+        "SELECT * FROM (SELECT i.id, i.name FROM items i WHERE i.name != :name) "
+        "AS asyncql_chunks ORDER BY `id` LIMIT 10"
+    )
+    assert chunks._next_query == (
+        "SELECT * FROM (SELECT i.id, i.name FROM items i WHERE i.name != :name) "
+        "AS asyncql_chunks WHERE `id` > :asyncql_after_0 ORDER BY `id` LIMIT 10"
+    )
+
+
+def test_composite_key() -> None:
+    rows = [{"a": 1, "b": 1}, {"a": 1, "b": 2}, {"a": 2, "b": 1}]
+
+    async def fetcher(query: str, params: Mapping[str, Any]) -> List[Dict[str, Any]]:
+        if "asyncql_after_0" not in params:
+            return rows[:2]
+
+        assert (params["asyncql_after_0"], params["asyncql_after_1"]) == (1, 2)
+        return rows[2:]
+
+    chunks = ChunkIterator(fetcher, "pairs", ["a", "b"], 2)
+    assert chunks._next_query == (
+        "SELECT * FROM pairs WHERE (a, b) > (:asyncql_after_0, :asyncql_after_1) "
+        "ORDER BY a, b LIMIT 2"
+    )
+
+    async def main() -> List[List[Dict[str, Any]]]:
+        return [chunk async for chunk in chunks]
+
+    assert asyncio.run(main()) == [rows[:2], rows[2:]]
+    assert chunks.last_key == (2, 1)
+
+
+def test_start_after() -> None:
+    fetcher = Fetcher(ROWS)
+    chunks = ChunkIterator(fetcher, "items", "id", 2, start_after=[3])
+
+    assert chunks.last_key == (3,)
+    assert asyncio.run(collect(chunks)) == [[4, 5]]
+    assert fetcher.calls[0][1] == {"asyncql_after_0": 3}
+
+
+def test_invalid_arguments() -> None:
+    fetcher = Fetcher(ROWS)
+
+    with pytest.raises(ValueError):
+        ChunkIterator(fetcher, "items", "id", 0)
+    with pytest.raises(ValueError):
+        ChunkIterator(fetcher, "items", [], 1)
+    with pytest.raises(ValueError):
+        ChunkIterator(fetcher, "items", ["a", "b"], 1, start_after=[1])
+
+
+class BlockingFetcher:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(
+        self,
+        query: str,
+        params: Mapping[str, Any],
+    ) -> List[Dict[str, Any]]:
+        self.calls += 1
+        if self.calls == 1:
+            return ROWS[:2]
+
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+
+        return []
+
+
+def test_aclose_cancels_prefetch() -> None:
+    fetcher = BlockingFetcher()
+
+    async def main() -> None:
+        async with ChunkIterator(fetcher, "items", "id", 2) as chunks:
+            async for _ in chunks:
+                await asyncio.sleep(0)
+                break
+
+        assert fetcher.calls == 2
+        assert fetcher.cancelled == 1
+        with pytest.raises(StopAsyncIteration):
+            await chunks.__anext__()
+
+    asyncio.run(main())
+
+
+def test_abandoned_iterator_cancels_prefetch() -> None:
+    fetcher = BlockingFetcher()
+
+    async def main() -> None:
+        chunks = ChunkIterator(fetcher, "items", "id", 2)
+        await chunks.__anext__()
+        await asyncio.sleep(0)
+
+        del chunks
+        gc.collect()
+        await asyncio.sleep(0)
+
+        assert fetcher.calls == 2
+        assert fetcher.cancelled == 1
+
+    asyncio.run(main())
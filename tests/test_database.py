@@ -0,0 +1,124 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from asyncql import Database
+from asyncql.models.admission import AdmissionController, PriorityClass
+
+
+class FakeTransaction:
+    def __init__(self, backend: "FakeBackend") -> None:
+        self._backend = backend
+
+    async def start(self, is_root: bool = False) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        await asyncio.sleep(0)
+        self._backend.rollbacks += 1
+
+
+class FakeConnection:
+    def __init__(self, backend: "FakeBackend") -> None:
+        self._backend = backend
+
+    async def acquire(self) -> None:
+        pass
+
+    async def release(self) -> None:
+        pass
+
+    def transaction(self) -> FakeTransaction:
+        return FakeTransaction(self._backend)
+
+
+class FakeBackend:
+    instances: List["FakeBackend"] = []
+
+    def __init__(self, database_url: Any, **kwargs: Any) -> None:
+        self.connects = 0
+        self.disconnects = 0
+        self.rollbacks = 0
+        self.instances.append(self)
+
+    async def connect(self) -> None:
+        self.connects += 1
+
+    async def disconnect(self) -> None:
+        await asyncio.sleep(0)
+        self.disconnects += 1
+
+    def connection(self) -> FakeConnection:
+        return FakeConnection(self)
+
+    def stats(self) -> Dict[str, int]:
+        return {}
+
+
+Database.BACKENDS["fake"] = f"{__name__}:FakeBackend"
+
+
+def create_database(**kwargs: Any) -> Database:
+    FakeBackend.instances.clear()
+    return Database("fake://localhost/test", **kwargs)
+
+
+@pytest.mark.parametrize("force_rollback", [False, True])
+def test_disconnect_runs_once(force_rollback: bool) -> None:
+    database = create_database(force_rollback=force_rollback)
+
+    async def main() -> None:
+        await database.connect()
+        await database.disconnect()
+
+    asyncio.run(main())
+
+    (backend,) = FakeBackend.instances
+    assert backend.disconnects == 1
+    assert backend.rollbacks == (1 if force_rollback else 0)
+
+
+@pytest.mark.parametrize("force_rollback", [False, True])
+def test_loop_shutdown_disconnects(force_rollback: bool) -> None:
+    database = create_database(force_rollback=force_rollback)
+
+    async def main() -> None:
+        await database.connect()
+
+    asyncio.run(main())
+
+    (backend,) = FakeBackend.instances
+    assert backend.disconnects == 1
+    assert backend.rollbacks == (1 if force_rollback else 0)
+    assert not database._states
+
+
+def test_reconnect_on_a_new_loop() -> None:
+    database = create_database()
+
+    async def main() -> None:
+        async with database:
+            pass
+
+    asyncio.run(main())
+    asyncio.run(main())
+
+    assert [backend.disconnects for backend in FakeBackend.instances] == [1, 1]
+
+
+def test_admission_split_between_loops_keeps_reservations() -> None:
+    def admission() -> AdmissionController:
+        return AdmissionController(
+            4,
+            {"hi": PriorityClass(reserved=3), "lo": PriorityClass()},
+        )
+
+    create_database(admission=admission())
+    create_database(admission=admission(), loops=1)
+
+    with pytest.raises(ValueError):
+        create_database(admission=admission(), loops=2)
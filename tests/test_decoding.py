@@ -0,0 +1,152 @@
+import decimal
+import json
+from typing import Any, Dict, List
+
+import pytest
+
+from asyncql.backends.decoding import (
+    DATETIME,
+    JSON,
+    NEWDECIMAL,
+    LazyValue,
+    ResultDecoder,
+    to_bytes,
+)
+
+LONG = 3
+VAR_STRING = 253
+
+DESCRIPTION = [("id", LONG), ("name", VAR_STRING), ("payload", JSON)]
+
+
+def test_lazy_column_needs_converter() -> None:
+    with pytest.raises(ValueError):
+        ResultDecoder(lazy_columns=["payload"])
+
+
+def test_lazy_value_decodes_once() -> None:
+    calls: List[Any] = []
+
+    def convert(value: Any) -> Any:
+        calls.append(value)
+        return value.upper()
+
+    value = LazyValue("abc", convert)
+    assert value.raw == "abc"
+    assert value.get() == "ABC"
+    assert value.get() == "ABC"
+    assert calls == ["abc"]
+
+
+def test_conversions_keep_encoders() -> None:
+    pymysql_converters = pytest.importorskip("pymysql.converters")
+
+    decoder = ResultDecoder(decimal_as_float=True, bytes_types=[DATETIME])
+    conversions = decoder.conversions(pymysql_converters.conversions)
+
+    assert conversions[NEWDECIMAL] is float
+    assert conversions[DATETIME] is to_bytes
+
+    # drivers split the encoders used for parameter escaping out of conv
+    encoders = {
+        key: value for key, value in conversions.items() if type(key) is not int
+    }
+    assert encoders[str] is pymysql_converters.conversions[str]
+    assert pymysql_converters.escape_item("it's", "utf8", mapping=encoders) == (
+        "'it\\'s'"
+    )
+
+
+def test_json_loads_replaces_json_decoder() -> None:
+    decoder = ResultDecoder(json_loads=json.loads)
+    assert decoder.conversions({})[JSON] is json.loads
+
+
+def test_to_bytes() -> None:
+    assert to_bytes("2024-01-02 03:04:05") == b"2024-01-02 03:04:05"
+    assert to_bytes("é") == "é".encode()
+    assert to_bytes(b"\x00\xff") == b"\x00\xff"
+
+
+def test_plan_is_cached_per_schema() -> None:
+    decoder = ResultDecoder(columns={"payload": json.loads})
+
+    plan = decoder.plan(DESCRIPTION)
+    assert plan == ((2, "payload", json.loads, False),)
+    assert decoder.plan(list(DESCRIPTION)) is plan
+
+    assert decoder.plan([("payload", VAR_STRING)]) is not plan
+
+
+def test_plan_without_columns() -> None:
+    assert ResultDecoder().plan(DESCRIPTION) == ()
+    assert ResultDecoder(columns={"payload": json.loads}).plan(None) == ()
+
+
+def test_decode_dicts() -> None:
+    decoder = ResultDecoder(
+        columns={"payload": json.loads, "name": str.upper},
+        lazy_columns=["payload"],
+    )
+    rows: List[Dict[str, Any]] = [
+        {"id": 1, "name": "a", "payload": '{"a": 1}'},
+        {"id": 2, "name": None, "payload": None},
+    ]
+
+    decoded = decoder.decode_dicts(rows, DESCRIPTION)
+
+    assert decoded[0]["id"] == 1
+    assert decoded[0]["name"] == "A"
+    assert isinstance(decoded[0]["payload"], LazyValue)
+    assert decoded[0]["payload"].get() == {"a": 1}
+
+    # NULLs are never handed to converters
+    assert decoded[1] == {"id": 2, "name": None, "payload": None}
+
+
+def test_decode_dicts_repeated_column_names() -> None:
+    decoder = ResultDecoder(columns={"payload": json.loads})
+    description = [("payload", JSON), ("payload", JSON)]
+    rows = [{"payload": "[1]", "b.payload": "[2]"}]
+
+    assert decoder.decode_dicts(rows, description) == [
+        {"payload": [1], "b.payload": [2]},
+    ]
+
+
+def test_decode_dicts_qualified_converter_wins() -> None:
+    decoder = ResultDecoder(
+        columns={"payload": json.loads, "b.payload": lambda value: value},
+    )
+    description = [("payload", JSON), ("payload", JSON)]
+    rows = [{"payload": "[1]", "b.payload": "[2]"}]
+
+    assert decoder.decode_dicts(rows, description) == [
+        {"payload": [1], "b.payload": "[2]"},
+    ]
+
+
+def test_decode_dicts_empty() -> None:
+    decoder = ResultDecoder(columns={"payload": json.loads})
+    rows: List[Any] = []
+    assert decoder.decode_dicts(rows, DESCRIPTION) is rows
+
+
+def test_decode_tuples() -> None:
+    decoder = ResultDecoder(columns={"payload": json.loads, "price": decimal.Decimal})
+    description = [("payload", JSON), ("price", NEWDECIMAL), ("payload", JSON)]
+
+    decoded = decoder.decode_tuples(
+        [("[1]", "1.50", "[2]"), (None, None, "[3]")],
+        description,
+    )
+
+    assert [list(row) for row in decoded] == [
+        [[1], decimal.Decimal("1.50"), [2]],
+        [None, None, [3]],
+    ]
+
+
+def test_decode_tuples_without_plan_returns_rows() -> None:
+    rows = [(1, "a", "{}")]
+    assert ResultDecoder().decode_tuples(rows, DESCRIPTION) is rows
@@ -0,0 +1,103 @@
+import asyncio
+from typing import List, Tuple
+
+from asyncql.common import locks
+
+
+async def _noop() -> None:
+    pass
+
+
+def test_try_acquire_when_free() -> None:
+    async def main() -> None:
+        lock = locks.Lock()
+
+        assert lock.try_acquire() is locks.SYNC_ACQUIRE
+        if locks.SYNC_ACQUIRE:
+            assert lock.locked()
+            assert not lock.try_acquire()
+            lock.release()
+
+        assert not lock.locked()
+
+    asyncio.run(main())
+
+
+def test_try_acquire_does_not_jump_queued_waiters() -> None:
+    async def main() -> None:
+        lock = locks.Lock()
+        await lock.acquire()
+
+        waiter = asyncio.ensure_future(lock.acquire())
+        await asyncio.sleep(0)
+
+        # the waiter is woken but hasn't run yet, and keeps its turn
+        lock.release()
+        assert not lock.try_acquire()
+
+        await waiter
+        assert lock.locked()
+        lock.release()
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_leaves_lock_usable() -> None:
+    async def main() -> None:
+        lock = locks.Lock()
+        await lock.acquire()
+
+        waiter = asyncio.ensure_future(lock.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            pass
+
+        lock.release()
+        await lock.run(_noop)
+        assert not lock.locked()
+
+    asyncio.run(main())
+
+
+def test_run_serialises_concurrent_callers() -> None:
+    async def main() -> None:
+        lock = locks.Lock()
+        events: List[Tuple[str, int]] = []
+
+        async def work(index: int) -> int:
+            events.append(("start", index))
+            await asyncio.sleep(0)
+            events.append(("end", index))
+            return index
+
+        results = await asyncio.gather(*(lock.run(work, index) for index in range(10)))
+
+        assert results == list(range(10))
+        for position in range(0, len(events), 2):
+            assert events[position][0] == "start"
+            assert events[position + 1] == ("end", events[position][1])
+
+        assert not lock.locked()
+
+    asyncio.run(main())
+
+
+def test_run_releases_on_error() -> None:
+    async def main() -> None:
+        lock = locks.Lock()
+
+        async def fail() -> None:
+            raise ValueError("boom")
+
+        try:
+            await lock.run(fail)
+        except ValueError:
+            pass
+
+        assert not lock.locked()
+
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+import asyncio
+from collections import deque
+from typing import Any, Deque, List, Set
+
+from asyncql.backends.mysql_base import BaseMySQLBackend
+from asyncql.backends.pool import PoolMaintainer
+
+
+class FakeConnection:
+    def __init__(self, last_usage: float) -> None:
+        self.last_usage = last_usage
+        self.pings = 0
+        self.closed = False
+
+    async def ping(self, reconnect: bool = False) -> None:
+        self.pings += 1
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakePool:
+    def __init__(self) -> None:
+        self._free: Deque[FakeConnection] = deque()
+        self._used: Set[FakeConnection] = set()
+        self._cond = asyncio.Condition()
+        self._acquiring = 0
+        self._closing = False
+        self.maxsize = 10
+
+    @property
+    def size(self) -> int:
+        return len(self._free) + len(self._used) + self._acquiring
+
+
+def maintainer(pool: FakePool, **kwargs: Any) -> PoolMaintainer:
+    async def connect() -> FakeConnection:
+        return FakeConnection(asyncio.get_running_loop().time())
+
+    return PoolMaintainer(pool, connect, **kwargs)
+
+
+def test_max_idle_closes_without_ping() -> None:
+    async def main() -> None:
+        now = asyncio.get_running_loop().time()
+        pool = FakePool()
+        stale, fresh = FakeConnection(now - 60), FakeConnection(now)
+        pool._free.extend([stale, fresh])
+
+        await maintainer(pool, max_idle=30.0).check()
+
+        assert list(pool._free) == [fresh]
+        assert stale.closed and not stale.pings
+        assert not fresh.pings
+
+    asyncio.run(main())
+
+
+def test_idle_threshold_pings() -> None:
+    async def main() -> None:
+        now = asyncio.get_running_loop().time()
+        pool = FakePool()
+        idle = FakeConnection(now - 60)
+        pool._free.append(idle)
+
+        await maintainer(pool, idle_threshold=30.0, max_idle=120.0).check()
+
+        assert list(pool._free) == [idle]
+        assert idle.pings == 1 and not idle.closed
+        assert not pool._used
+
+    asyncio.run(main())
+
+
+def test_max_lifetime_counts_from_warm_up() -> None:
+    async def main() -> None:
+        pool = FakePool()
+        pool_maintainer = maintainer(pool, warm_up=2, max_lifetime=0.05)
+        await pool_maintainer.start()
+        warmed: List[FakeConnection] = list(pool._free)
+        assert len(warmed) == 2
+
+        await pool_maintainer.check()
+        assert list(pool._free) == warmed
+
+        await asyncio.sleep(0.1)
+        for connection in warmed:
+            connection.last_usage = asyncio.get_running_loop().time()
+
+        # expired connections are replaced up to the warm up target
+        await pool_maintainer.check()
+        assert all(connection.closed for connection in warmed)
+        assert len(pool._free) == 2
+        assert not set(pool._free) & set(warmed)
+
+    asyncio.run(main())
+
+
+def test_max_lifetime_of_connections_in_use() -> None:
+    async def main() -> None:
+        pool = FakePool()
+        connection = FakeConnection(asyncio.get_running_loop().time())
+        pool._used.add(connection)
+
+        pool_maintainer = maintainer(pool, max_lifetime=0.05)
+        await pool_maintainer.check()
+
+        await asyncio.sleep(0.1)
+        pool._used.remove(connection)
+        pool._free.append(connection)
+        connection.last_usage = asyncio.get_running_loop().time()
+
+        await pool_maintainer.check()
+        assert connection.closed
+        assert not pool._free
+
+    asyncio.run(main())
+
+
+def test_pool_never_recycles_on_acquire() -> None:
+    for max_idle in (None, 5.0):
+        backend = BaseMySQLBackend("mysql://localhost/test", max_idle=max_idle)
+        assert backend._connection_options["pool_recycle"] == -1
@@ -0,0 +1,164 @@
+import datetime
+import decimal
+import enum
+import uuid
+from typing import Any
+
+import pytest
+
+from asyncql.common.query import (
+    ENCODERS,
+    _encode_int,
+    _encode_str,
+    _sanitize_value,
+    count_statements,
+    parse_query,
+    strip_terminator,
+)
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+
+
+class Level(enum.IntEnum):
+    HIGH = 3
+
+
+class Plain(enum.Enum):
+    ONE = datetime.date(2024, 1, 2)
+
+
+class Name(str):
+    pass
+
+
+class Flag(int):
+    pass
+
+
+def test_parse_query() -> None:
+    assert parse_query("SELECT * FROM t WHERE id = :id", {"id": 1}) == (
+        "SELECT * FROM t WHERE id = 1"
+    )
+    assert parse_query("SELECT :a, :b, :a", {"a": "x", "b": None}) == (
+        "SELECT 'x', NULL, 'x'"
+    )
+    assert parse_query("SELECT 1", {}) == "SELECT 1"
+
+
+def test_parse_query_leaves_unbound_names() -> None:
+    assert parse_query("SELECT '12:30', :id", {"id": 1}) == "SELECT '12:30', 1"
+    assert parse_query("SELECT :missing", {}) == "SELECT :missing"
+
+
+def test_parse_query_rejects_unknown_params() -> None:
+    with pytest.raises(ValueError):
+        parse_query("SELECT :id", {"id": 1, "name": "a"})
+    with pytest.raises(ValueError):
+        parse_query("SELECT 1", {"id": 1})
+
+
+@pytest.mark.parametrize(
+    "value, encoded",
+    [
+        (True, "true"),
+        (-12, "-12"),
+        (1.5, "1.5"),
+        (None, "NULL"),
+        (b"\x00\xffa", "X'00ff61'"),
+        (bytearray(b"\x01"), "X'01'"),
+        (memoryview(b"\x02"), "X'02'"),
+        (decimal.Decimal("1.50"), "1.50"),
+        (decimal.Decimal("1E+3"), "1000"),
+        (datetime.datetime(2024, 1, 2, 3, 4, 5), "'2024-01-02 03:04:05'"),
+        (datetime.date(2024, 1, 2), "'2024-01-02'"),
+        (datetime.time(3, 4, 5, 6), "'03:04:05.000006'"),
+        (datetime.timedelta(days=1, hours=2, seconds=3), "'26:00:03'"),
+        (datetime.timedelta(microseconds=-1), "'-0:00:00.000001'"),
+        (-datetime.timedelta(hours=30, minutes=1), "'-30:01:00'"),
+        (uuid.UUID(int=1), "'00000000-0000-0000-0000-000000000001'"),
+        (Color.RED, "'red'"),
+        (Level.HIGH, "3"),
+        (Plain.ONE, "'2024-01-02'"),
+        ("it's\n\\", "'it\\'s\\n\\\\'"),
+        ([1, 2], "(1,2)"),
+        ((1.5,), "(1.5)"),
+        ({3}, "(3)"),
+        ([1, "a", None], "(1,'a',NULL)"),
+        ([], "()"),
+    ],
+)
+def test_encoding(value: Any, encoded: str) -> None:
+    assert _sanitize_value(value) == encoded
+
+
+@pytest.mark.parametrize(
+    "value, encoded",
+    [
+        (["a", "b"], "('a','b')"),
+        (["it's", "%"], "('it\\'s','\\%')"),
+        (["a,b", "','"], "('a,b','\\',\\'')"),
+        # the separator can't be told apart when an element contains it
+        (["a\x01b", "c"], "('a\x01b','c')"),
+        (["\x01", "\x01"], "('\x01','\x01')"),
+        ([""], "('')"),
+    ],
+)
+def test_string_sequence_fast_path(value: Any, encoded: str) -> None:
+    assert _sanitize_value(value) == encoded
+    assert _sanitize_value(tuple(value)) == encoded
+
+
+def test_subclass_encoder_is_resolved_and_cached() -> None:
+    assert _sanitize_value(Name("it's")) == "'it\\'s'"
+    assert ENCODERS[Name] is _encode_str
+
+    assert _sanitize_value(Flag(7)) == "7"
+    assert ENCODERS[Flag] is _encode_int
+
+    # enum mixins resolve to the enum encoder, not their str/int base
+    _sanitize_value(Color.RED)
+    assert ENCODERS[Color] is not _encode_str
+
+
+@pytest.mark.parametrize(
+    "query, statements",
+    [
+        ("SELECT 1", 1),
+        ("SELECT 1;", 1),
+        ("SELECT 1;;", 1),
+        ("SELECT 1; -- done", 1),
+        ("SELECT ';' AS value", 1),
+        ('SELECT "a;b", `c;d` FROM t', 1),
+        ("SELECT 'it\\'s;'", 1),
+        ("SELECT 1 -- a; comment\nFROM t", 1),
+        ("SELECT 1 # a; comment", 1),
+        ("SELECT 1 /* a; comment */", 1),
+        ("SELECT 1 --; is no comment", 2),
+        ("SELECT 1; SELECT 2", 2),
+        ("SELECT 1;\n/* c */ SELECT 2;", 2),
+        ("", 0),
+        (";", 0),
+        ("-- only a comment", 0),
+    ],
+)
+def test_count_statements(query: str, statements: int) -> None:
+    assert count_statements(query) == statements
+
+
+@pytest.mark.parametrize(
+    "query, stripped",
+    [
+        ("SELECT 1", "SELECT 1"),
+        ("  SELECT 1;\n", "SELECT 1"),
+        ("SELECT 1;;", "SELECT 1"),
+        ("SELECT 1; -- done", "SELECT 1 -- done"),
+        ("SELECT 1 -- done;", "SELECT 1 -- done;"),
+        ("SELECT 1; /* a */ # b", "SELECT 1 /* a */ # b"),
+        ("SELECT ';'", "SELECT ';'"),
+        ("SELECT 1 /* ; */", "SELECT 1 /* ; */"),
+    ],
+)
+def test_strip_terminator(query: str, stripped: str) -> None:
+    assert strip_terminator(query) == stripped
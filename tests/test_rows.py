@@ -0,0 +1,102 @@
+import collections
+import dataclasses
+from typing import Any, Optional
+
+import pytest
+
+from asyncql.common.rows import map_rows, row_factory
+
+
+@dataclasses.dataclass
+class Item:
+    id: int
+    name: str
+    note: Optional[str] = None
+
+
+Pair = collections.namedtuple("Pair", ["left", "right"])
+
+
+class Slotted:
+    __slots__ = ("id", "name")
+
+    id: int
+    name: str
+
+
+class Plain:
+    def __init__(self, id: int, flag: bool = False, name: str = "") -> None:
+        self.id = id
+        self.flag = flag
+        self.name = name
+
+
+class Extras:
+    def __init__(self, id: int, **kwargs: Any) -> None:
+        self.id = id
+        self.extras = kwargs
+
+
+class Record:
+    def __init__(self, **kwargs: Any) -> None:
+        self.values = kwargs
+
+
+class PositionalOnly:
+    def __init__(self, a: int = 0, b: int = 0, /, c: int = 0) -> None:
+        self.values = (a, b, c)
+
+
+def test_dataclass() -> None:
+    items = map_rows(["id", "name", "ignored"], [(1, "a", None), (2, "b", None)], Item)
+    assert items == [Item(1, "a"), Item(2, "b")]
+
+
+def test_namedtuple_columns_in_any_order() -> None:
+    assert map_rows(["right", "left"], [(2, 1)], Pair) == [Pair(left=1, right=2)]
+
+
+def test_slotted_class_without_constructor() -> None:
+    (item,) = map_rows(["name", "id"], [("a", 1)], Slotted)
+    assert (item.id, item.name) == (1, "a")
+
+
+def test_keywords_after_skipped_parameter() -> None:
+    (item,) = map_rows(["name", "id"], [("a", 1)], Plain)
+    assert (item.id, item.flag, item.name) == (1, False, "a")
+
+
+def test_missing_required_column() -> None:
+    with pytest.raises(TypeError):
+        map_rows(["name"], [("a",)], Item)
+
+
+def test_positional_only_parameters() -> None:
+    (item,) = map_rows(["c", "a"], [(3, 1)], PositionalOnly)
+    assert item.values == (1, 0, 3)
+
+    # b can't be passed once a is skipped
+    with pytest.raises(TypeError):
+        map_rows(["b"], [(2,)], PositionalOnly)
+
+
+def test_duplicate_columns() -> None:
+    with pytest.raises(TypeError):
+        map_rows(["id", "id"], [(1, 2)], Item)
+
+
+def test_var_keyword_target_receives_every_column() -> None:
+    (record,) = map_rows(
+        ["id", "name", "b.name", "class"], [(1, "a", "b", "c")], Record
+    )
+    assert record.values == {"id": 1, "name": "a", "b.name": "b", "class": "c"}
+
+
+def test_var_keyword_receives_unmatched_columns() -> None:
+    (item,) = map_rows(["name", "id"], [("a", 1)], Extras)
+    assert item.id == 1
+    assert item.extras == {"name": "a"}
+
+
+def test_factory_is_cached() -> None:
+    assert row_factory(("id", "name"), Item) is row_factory(("id", "name"), Item)